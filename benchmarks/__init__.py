@@ -0,0 +1,3 @@
+"""
+    Benchmarks of the pandas_extras functions on synthetic data. Run with ``make bench``.
+"""
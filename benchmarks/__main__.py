@@ -0,0 +1,126 @@
+"""
+    Runs the benchmark cases and compares them to a stored baseline.
+
+    .. code-block:: bash
+
+        $ python -m benchmarks --rows 1000 100000 --filter expand
+        $ python -m benchmarks --baseline benchmarks/baseline.json --save
+"""
+import argparse
+import gc
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+from .cases import CASES
+
+DEFAULT_ROWS = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+
+
+def measure(func, repeat):
+    """
+        Returns the best wall time of ``repeat`` calls of ``func``, and the peak of the memory
+        allocated by an additional call, traced by :mod:`tracemalloc`.
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak
+
+
+def run(names, rows, repeat):
+    """
+        Runs the cases in ``names`` at every number of ``rows``. Yields the name, the number of
+        rows and the measured time and peak memory.
+    """
+    for name in names:
+        for count in rows:
+            func = CASES[name](count)
+            seconds, peak = measure(func, repeat if count < 10 ** 6 else 1)
+            yield name, count, seconds, peak
+            del func
+
+
+def compare(result, baseline, threshold):
+    """
+        Returns the ratio of ``result`` to its ``baseline`` for time and memory, and whether
+        any of them exceeds ``threshold``. Differences below a millisecond or a mebibyte are
+        considered noise.
+    """
+    if baseline is None:
+        return '', False
+    time_ratio = result['seconds'] / max(baseline['seconds'], 1e-9)
+    memory_ratio = result['peak_bytes'] / max(baseline['peak_bytes'], 1)
+    regressed = (
+        time_ratio > threshold and result['seconds'] - baseline['seconds'] > 1e-3 or
+        memory_ratio > threshold and result['peak_bytes'] - baseline['peak_bytes'] > 2 ** 20
+    )
+    return f'{time_ratio:8.2f}x {memory_ratio:8.2f}x{"  REGRESSION" if regressed else ""}', \
+        regressed
+
+
+def main(argv=None):
+    """
+        Command line entry point. Returns the exit code, which is ``1`` if any case regressed
+        compared to the baseline.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks', description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS,
+                        help='Numbers of rows to run the cases with.')
+    parser.add_argument('--filter', default='',
+                        help='Regular expression selecting the cases to run.')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Number of timed calls below a million rows, the best is kept.')
+    parser.add_argument('--baseline', help='JSON file of the results to compare to.')
+    parser.add_argument('--save', action='store_true',
+                        help='Store the results in the baseline file, updating it.')
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help='Ratio to the baseline time or memory reported as regression.')
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+    elif args.baseline and not args.save:
+        print(f'No baseline found at {args.baseline}, store one with --save.')
+    names = [name for name in CASES if re.search(args.filter, name)]
+    results = dict(baseline) if args.save else {}
+
+    print(f'{"case":<32} {"rows":>10} {"seconds":>10} {"peak MiB":>10} '
+          f'{"time":>9} {"memory":>9}')
+    regressions = 0
+    for name, count, seconds, peak in run(names, args.rows, args.repeat):
+        key = f'{name}@{count}'
+        result = {'seconds': seconds, 'peak_bytes': peak}
+        ratios, regressed = compare(result, baseline.get(key), args.threshold)
+        regressions += regressed
+        results[key] = result
+        print(f'{name:<32} {count:>10} {seconds:>10.4f} {peak / 2 ** 20:>10.2f} {ratios}',
+              flush=True)
+
+    if args.save and args.baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+    if regressions:
+        print(f'{regressions} case(s) regressed more than {args.threshold}x.')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""
+    Contains the benchmark cases. Every case builds its input from the number of rows outside of
+    the measurement, and returns the callable to measure.
+"""
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from pandas_extras import (
+    check_duplicated_labels, clear_nan, concatenate_columns, convert_to_type, DatetimeCache,
+    expand_list, expand_lists, extract_dict_key, extract_dictionary, filter_list,
+    flatten_adjacency_list, from_native_records, get_adjacency_list_depth, iter_native_rows,
+    list_to_indicators, map_list, merge_column_groups, merge_columns, NativeDict,
+    optimize_memory, parallel_pipe, Pipeline, reduce_list, to_native_records, truncate_strings,
+)
+
+from .generators import (
+    date_strings, deep_tree, numeric_frame, skewed_lists, sparse_dicts, wide_tree,
+)
+
+CASES = OrderedDict()
+
+
+def case(name):
+    """
+        Registers a benchmark case under ``name``.
+    """
+    def register(builder):
+        CASES[name] = builder
+        return builder
+    return register
+
+
+def _lists_frame(rows):
+    return pd.DataFrame({'id': np.arange(rows), 'values': skewed_lists(rows)})
+
+
+def _dicts_frame(rows):
+    return pd.DataFrame({'id': np.arange(rows), 'samples': sparse_dicts(rows)})
+
+
+def _mixed_frame(rows):
+    frame = numeric_frame(rows, columns=3)
+    frame['date'] = pd.to_datetime(date_strings(rows), errors='coerce')
+    frame['label'] = date_strings(rows, distinct=50)
+    return frame
+
+
+@case('check_duplicated_labels')
+def _check_duplicated_labels(rows):
+    frame = numeric_frame(rows)
+    return lambda: check_duplicated_labels(frame)
+
+
+@case('clear_nan')
+def _clear_nan(rows):
+    frame = _mixed_frame(rows)
+    return lambda: clear_nan(frame)
+
+
+@case('convert_to_type.number')
+def _convert_numbers(rows):
+    frame = pd.DataFrame({'number': numeric_frame(rows, columns=1)['col_0'].round().astype(str)})
+    return lambda: convert_to_type(frame, {'number': 'number'})
+
+
+@case('convert_to_type.date')
+def _convert_dates(rows):
+    frame = pd.DataFrame({'date': date_strings(rows)})
+    return lambda: convert_to_type(frame, {'date': 'date'}, kwargs_map={
+        'date': {'format': '%Y-%m-%d'}
+    })
+
+
+@case('convert_to_type.date_cache')
+def _convert_dates_cached(rows):
+    frame = pd.DataFrame({'date': date_strings(rows)})
+    return lambda: convert_to_type(frame, {'date': 'date'}, date_cache=DatetimeCache())
+
+
+@case('NativeDict')
+def _native_dict(rows):
+    frame = _mixed_frame(rows)
+    return lambda: frame.to_dict(orient='records', into=NativeDict)
+
+
+@case('to_native_records')
+def _to_native_records(rows):
+    frame = _mixed_frame(rows)
+    return lambda: to_native_records(frame)
+
+
+@case('iter_native_rows')
+def _iter_native_rows(rows):
+    frame = _mixed_frame(rows)
+    return lambda: sum(len(chunk) for chunk in iter_native_rows(frame))
+
+
+@case('from_native_records')
+def _from_native_records(rows):
+    records = to_native_records(numeric_frame(rows, columns=3))
+    schema = {'col_0': 'float32', 'col_1': 'float64', 'col_2': 'float64'}
+    return lambda: from_native_records(records, schema)
+
+
+@case('optimize_memory')
+def _optimize_memory(rows):
+    frame = _mixed_frame(rows)
+    return lambda: optimize_memory(frame)
+
+
+@case('truncate_strings')
+def _truncate_strings(rows):
+    frame = pd.DataFrame({'label': date_strings(rows), 'other': date_strings(rows, distinct=10)})
+    return lambda: truncate_strings(frame, {'label': 7, 'other': 4})
+
+
+@case('flatten_adjacency_list.wide')
+def _flatten_wide(rows):
+    frame = wide_tree(rows)
+    return lambda: flatten_adjacency_list(frame, 'parent')
+
+
+@case('flatten_adjacency_list.deep')
+def _flatten_deep(rows):
+    frame = deep_tree(rows)
+    return lambda: flatten_adjacency_list(frame, 'parent')
+
+
+@case('get_adjacency_list_depth')
+def _get_adjacency_list_depth(rows):
+    frame = deep_tree(rows)
+    return lambda: get_adjacency_list_depth(frame, 'parent')
+
+
+@case('parallel_pipe')
+def _parallel_pipe(rows):
+    frame = _mixed_frame(rows)
+    return lambda: parallel_pipe(frame, clear_nan, n_workers=2)
+
+
+@case('Pipeline')
+def _pipeline(rows):
+    frame = _dicts_frame(rows)
+    pipeline = Pipeline().\
+        pipe(extract_dictionary, 'samples', key_list=['key_0', 'key_1', 'key_3']).\
+        pipe(convert_to_type, {'number': ['samples.key_0', 'samples.key_3']}).\
+        pipe(truncate_strings, {'samples.key_1': 7})
+    return lambda: pipeline.run(frame)
+
+
+@case('concatenate_columns')
+def _concatenate_columns(rows):
+    frame = numeric_frame(rows, columns=4)
+    return lambda: concatenate_columns(frame, list(frame.columns), 'value', descriptor='source')
+
+
+@case('expand_list')
+def _expand_list(rows):
+    frame = _lists_frame(rows)
+    return lambda: expand_list(frame, 'values')
+
+
+@case('expand_lists')
+def _expand_lists(rows):
+    frame = _lists_frame(rows)
+    frame['others'] = skewed_lists(rows, seed=1)
+    return lambda: expand_lists(frame, ['values', 'others'])
+
+
+@case('extract_dict_key')
+def _extract_dict_key(rows):
+    frame = _dicts_frame(rows)
+    return lambda: extract_dict_key(frame, 'samples', 'key_0')
+
+
+@case('extract_dictionary')
+def _extract_dictionary(rows):
+    frame = _dicts_frame(rows)
+    return lambda: extract_dictionary(frame, 'samples')
+
+
+@case('filter_list')
+def _filter_list(rows):
+    frame = _lists_frame(rows)
+    return lambda: filter_list(frame, 'values', lambda values: values > 50)
+
+
+@case('list_to_indicators')
+def _list_to_indicators(rows):
+    frame = _lists_frame(rows)
+    return lambda: list_to_indicators(frame, 'values')
+
+
+@case('map_list')
+def _map_list(rows):
+    frame = _lists_frame(rows)
+    return lambda: map_list(frame, 'values', lambda values: values * 2)
+
+
+@case('merge_columns')
+def _merge_columns(rows):
+    frame = numeric_frame(rows)
+    return lambda: merge_columns(frame, list(frame.columns), 'merged', keep='first')
+
+
+@case('merge_column_groups')
+def _merge_column_groups(rows):
+    frame = numeric_frame(rows)
+    return lambda: merge_column_groups(frame, r'(col)_\d+', aggr='sum')
+
+
+@case('reduce_list')
+def _reduce_list(rows):
+    frame = _lists_frame(rows)
+    return lambda: reduce_list(frame, 'values', funcs=('len', 'sum', 'max', 'mean'))
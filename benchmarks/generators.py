@@ -0,0 +1,99 @@
+"""
+    Contains generators of synthetic data for the benchmarks. Every generator is seeded, so the
+    same number of rows always results in the same data.
+"""
+import numpy as np
+import pandas as pd
+
+SEED = 20200101
+CHUNK_ROWS = 100000
+
+
+def skewed_lists(rows, max_length=50, vocabulary=100, seed=SEED):
+    """
+        Lists of integers with Zipf distributed lengths, i.e. mostly short lists and a few long
+        ones. Every tenth row is empty and every twentieth is ``None``.
+    """
+    random = np.random.RandomState(seed)
+    lengths = np.minimum(random.zipf(1.5, rows), max_length)
+    lengths[::10] = 0
+    values = np.split(random.randint(0, vocabulary, lengths.sum()), np.cumsum(lengths)[:-1])
+    lists = [value.tolist() for value in values]
+    lists[::20] = [None] * len(lists[::20])
+    return lists
+
+
+def sparse_dicts(rows, keys=50, density=0.1, seed=SEED):
+    """
+        Dictionaries holding a random ``density`` fraction of ``keys`` keys, with integer,
+        string and ``None`` values. Every twentieth row is ``None``.
+    """
+    random = np.random.RandomState(seed)
+    names = [f'key_{index}' for index in range(keys)]
+    dicts = []
+    # The random matrices are drawn in chunks of rows to keep the memory bounded.
+    for start in range(0, rows, CHUNK_ROWS):
+        chunk_rows = min(CHUNK_ROWS, rows - start)
+        present = random.rand(chunk_rows, keys) < density
+        present[:, 0] = True
+        numbers = random.randint(0, 1000, (chunk_rows, keys))
+        for row_present, row_numbers in zip(present, numbers):
+            dicts.append({
+                names[index]: (
+                    int(row_numbers[index]) if index % 3 == 0 else
+                    f'value_{row_numbers[index]}' if index % 3 == 1 else None
+                )
+                for index in np.flatnonzero(row_present)
+            })
+    dicts[::20] = [None] * len(dicts[::20])
+    return dicts
+
+
+def date_strings(rows, distinct=1000, seed=SEED):
+    """
+        ISO formatted date strings drawn from ``distinct`` days, with some missing and some
+        invalid values.
+    """
+    random = np.random.RandomState(seed)
+    days = pd.date_range('2000-01-01', periods=distinct, freq='D').strftime('%Y-%m-%d').to_numpy()
+    values = days[random.randint(0, distinct, rows)].astype(object)
+    values[::50] = None
+    values[::97] = 'not a date'
+    return values
+
+
+def numeric_frame(rows, columns=10, null_ratio=0.1, seed=SEED):
+    """
+        A DataFrame of float columns named ``col_0``, ``col_1``, ... with a ``null_ratio``
+        fraction of missing values.
+    """
+    random = np.random.RandomState(seed)
+    values = random.rand(rows, columns) * 1000
+    values[random.rand(rows, columns) < null_ratio] = np.nan
+    return pd.DataFrame(values, columns=[f'col_{index}' for index in range(columns)])
+
+
+def wide_tree(rows, seed=SEED):
+    """
+        Adjacency list of a shallow tree, where every node hangs on one of the first
+        ``sqrt(rows)`` nodes. Roots have ``None`` parent.
+    """
+    random = np.random.RandomState(seed)
+    roots = max(int(np.sqrt(rows)), 1)
+    parents = random.randint(0, roots, rows).astype(float)
+    parents[:roots] = np.nan
+    return pd.DataFrame({'parent': parents}, index=pd.RangeIndex(rows, name='node'))
+
+
+def deep_tree(rows, depth=20, seed=SEED):
+    """
+        Adjacency list of a tree with ``depth`` levels of equal width. Every node hangs on a
+        random node of the previous level. Roots have ``None`` parent.
+    """
+    random = np.random.RandomState(seed)
+    width = max(rows // depth, 1)
+    nodes = np.arange(rows)
+    level_starts = nodes // width * width
+    parents = (level_starts - width + random.randint(0, width, rows)).astype(float)
+    parents[nodes < width] = np.nan
+    return pd.DataFrame({'parent': parents}, index=pd.RangeIndex(rows, name='node'))
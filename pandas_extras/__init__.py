@@ -2,31 +2,71 @@
     Contains functions to operate on :class:`DataFrames <pandas.DataFrame>`. All can be chained
     with the :meth:`pipe() <pandas.DataFrame.pipe>` method,
     which is the preferred way in this project.
+
+    None of the functions modify the DataFrame they get. The functions that add or replace
+    columns work on a shallow copy, which shares the data of the unchanged columns, unless they
+    are called with ``inplace=True``. This holds with pandas' copy-on-write mode as well.
 """
-from .conversions import clear_nan, convert_to_type, NativeDict, truncate_strings
+from .conversions import (
+    clear_nan,
+    ConversionPlan,
+    convert_to_type,
+    DatetimeCache,
+    from_native_records,
+    iter_native_rows,
+    NativeDict,
+    optimize_memory,
+    to_native_records,
+    truncate_strings
+)
 from .hierarchy import flatten_adjacency_list, get_adjacency_list_depth
+from .instrumentation import add_callback, CallEvent, instrument, remove_callback
+from .parallel import parallel_pipe
+from .pipeline import Pipeline
 from .transformations import (
     concatenate_columns,
     expand_list,
     expand_lists,
     extract_dict_key,
     extract_dictionary,
-    merge_columns
+    filter_list,
+    list_to_indicators,
+    map_list,
+    merge_column_groups,
+    merge_columns,
+    reduce_list
 )
 from .util import check_duplicated_labels
 
 __all__ = [
+    'add_callback',
+    'CallEvent',
     'clear_nan',
     'concatenate_columns',
+    'ConversionPlan',
     'convert_to_type',
+    'DatetimeCache',
     'expand_list',
     'expand_lists',
     'extract_dict_key',
     'extract_dictionary',
+    'filter_list',
     'flatten_adjacency_list',
+    'from_native_records',
     'get_adjacency_list_depth',
+    'instrument',
+    'iter_native_rows',
+    'list_to_indicators',
+    'map_list',
+    'merge_column_groups',
     'merge_columns',
     'NativeDict',
+    'optimize_memory',
+    'parallel_pipe',
+    'Pipeline',
+    'to_native_records',
+    'reduce_list',
+    'remove_callback',
     'truncate_strings',
 ]
 
@@ -1,7 +1,104 @@
 """
     Contains function that help in converting between types
 """
+from collections import OrderedDict
+from decimal import Decimal
+from itertools import repeat
+from threading import Lock
+
+import numpy as np
 import pandas as pd
+import pandas.api.types as ptypes
+
+from .instrumentation import instrumented
+from .parallel import _map_threaded
+from .util import _set_column
+
+# Since pandas 2.0 the format of the whole column is inferred from its first element.
+_DATETIME_DEFAULTS = {'format': 'mixed'} if int(pd.__version__.split('.')[0]) >= 2 else {}
+
+
+def _convert_default(value):
+    """
+        Fallback conversion of values without a registered converter.
+    """
+    try:
+        if pd.isnull(value):
+            return None
+    except (TypeError, ValueError):
+        return value
+    if hasattr(value, 'dtype'):
+        mapper = {'i': int, 'u': int, 'f': float, 'b': bool}
+        return mapper.get(value.dtype.kind, lambda x: x)(value)
+    return value
+
+
+def _convert_float(value):
+    """Converts floats to :class:`float`, ``NaN`` to ``None``."""
+    return None if value != value else float(value)  # pylint: disable=comparison-with-itself
+
+
+def _convert_decimal(value):
+    """Keeps decimals, except ``NaN`` which is converted to ``None``."""
+    return None if value.is_nan() else value
+
+
+def _convert_datetime(value):
+    """Converts datetimes to :class:`datetime.datetime`, ``NaT`` to ``None``."""
+    return None if pd.isnull(value) else pd.Timestamp(value).to_pydatetime()
+
+
+def _convert_timedelta(value):
+    """Converts timedeltas to :class:`datetime.timedelta`, ``NaT`` to ``None``."""
+    return None if pd.isnull(value) else pd.Timedelta(value).to_pytimedelta()
+
+
+def _convert_null(_):
+    """Converts null values to ``None``."""
+    return None
+
+
+def _keep(value):
+    """Keeps native values as they are."""
+    return value
+
+
+_VALUE_CONVERTERS = {
+    type(None): _keep,
+    str: _keep,
+    int: _keep,
+    bool: _keep,
+    float: _convert_float,
+    Decimal: _convert_decimal,
+    np.integer: int,
+    np.floating: _convert_float,
+    np.bool_: bool,
+    np.datetime64: _convert_datetime,
+    np.timedelta64: _convert_timedelta,
+    pd.Timestamp: _convert_datetime,
+    pd.Timedelta: _convert_timedelta,
+    type(pd.NaT): _convert_null,
+    type(pd.NA): _convert_null,
+}
+_DEFAULT_VALUE_CONVERTERS = dict(_VALUE_CONVERTERS)
+_DTYPE_CONVERTERS = {}
+_RESOLVED_VALUE_CONVERTERS = {}
+_RESOLVED_COLUMN_CONVERTERS = {}
+
+
+def _value_converter(value_type):
+    """
+        Returns the converter registered for ``value_type`` or for its closest base class.
+    """
+    try:
+        return _RESOLVED_VALUE_CONVERTERS[value_type]
+    except KeyError:
+        converter = next(
+            (_VALUE_CONVERTERS[base] for base in value_type.__mro__ if base in _VALUE_CONVERTERS),
+            _convert_default
+        )
+        _RESOLVED_VALUE_CONVERTERS[value_type] = converter
+        return converter
 
 
 class NativeDict(dict):
@@ -13,6 +110,11 @@ class NativeDict(dict):
 
             >>> df.to_dict(orient='records', into=NativeDict)
 
+        Values are converted by the converter registered for their type, see
+        :meth:`register_converter`. Numpy scalars, :class:`Timestamp <pandas.Timestamp>`,
+        :class:`Timedelta <pandas.Timedelta>` and null values, including ``NaN`` decimals and
+        :data:`pandas.NA`, are handled by default.
+
         .. note::
 
             Needed until `#21256 <https://github.com/pandas-dev/pandas/issues/21256>`_ is resolved.
@@ -23,40 +125,389 @@ class NativeDict(dict):
     @staticmethod
     def convert_if_needed(value):
         """
-            Converts `value` to native python type.
+            Converts `value` to native python type, with the converter registered for its type.
+        """
+        return _value_converter(type(value))(value)
+
+    @staticmethod
+    def register_converter(key, converter):
+        """
+            Registers ``converter`` to convert values to native python type.
 
-            .. warning::
+            .. code-block:: python
 
-                Only :class:`Timestamp <pandas.Timestamp>` and numpy :class:`dtypes <numpy.dtype>`
-                are converted.
+                >>> NativeDict.register_converter(Decimal, float)
+                >>> NativeDict.register_converter('category', str)
+
+            :param key: Either a type, then the converter is used for values of this type or
+                        its subclasses, or a dtype, then the converter is used by
+                        :func:`to_native_records` and :func:`iter_native_rows` for every non-null
+                        value of the columns of this dtype. Parametrised dtypes given without
+                        parameters, like ``'category'`` or
+                        :class:`CategoricalDtype <pandas.CategoricalDtype>`, match every dtype
+                        of their family.
+            :param converter: Callable getting a single value and returning the converted one.
         """
-        if pd.isnull(value):
-            return None
-        if isinstance(value, pd.Timestamp):
-            return value.to_pydatetime()
-        if hasattr(value, 'dtype'):
-            mapper = {'i': int, 'u': int, 'f': float}
-            _type = mapper.get(value.dtype.kind, lambda x: x)
-            return _type(value)
-        return value
+        if _is_value_type(key):
+            _VALUE_CONVERTERS[key] = converter
+        else:
+            _DTYPE_CONVERTERS[_dtype_key(key)] = converter
+        _RESOLVED_VALUE_CONVERTERS.clear()
+        _RESOLVED_COLUMN_CONVERTERS.clear()
+
+    @staticmethod
+    def unregister_converter(key):
+        """
+            Removes the converter registered with :meth:`register_converter`. The default
+            conversion of ``key`` is restored.
+
+            :param key: The type or dtype the converter was registered for.
+
+            :raises: :exc:`ValueError` if no converter is registered for ``key``.
+        """
+        if _is_value_type(key):
+            default = _DEFAULT_VALUE_CONVERTERS.get(key)
+            if _VALUE_CONVERTERS.get(key, default) is default:
+                raise ValueError(f'No converter is registered for {key}.')
+            if default is None:
+                del _VALUE_CONVERTERS[key]
+            else:
+                _VALUE_CONVERTERS[key] = default
+        elif _DTYPE_CONVERTERS.pop(_dtype_key(key), None) is None:
+            raise ValueError(f'No converter is registered for {key}.')
+        _RESOLVED_VALUE_CONVERTERS.clear()
+        _RESOLVED_COLUMN_CONVERTERS.clear()
+
+
+def _is_value_type(key):
+    """
+        Whether ``key`` of a converter is a type of values, rather than a dtype.
+    """
+    dtype_classes = (np.dtype, pd.api.extensions.ExtensionDtype)
+    return isinstance(key, type) and not issubclass(key, dtype_classes)
+
+
+def _dtype_key(key):
+    """
+        Returns the key of the dtype converters for ``key``, which is the dtype class for a
+        whole dtype family, e.g. for ``'category'``, and the exact dtype otherwise.
+    """
+    if isinstance(key, type) and issubclass(key, pd.api.extensions.ExtensionDtype):
+        return key
+    dtype = ptypes.pandas_dtype(key)
+    if isinstance(key, str) and key == type(dtype).name or \
+            isinstance(dtype, pd.CategoricalDtype) and dtype.categories is None:
+        return type(dtype)
+    return dtype
+
+
+@instrumented
+def to_native_records(dataframe, into=dict):
+    """
+        Converts ``dataframe`` to a list of records holding native python types only. The
+        result is the same as of ``to_dict(orient='records', into=NativeDict)``, but the values
+        are converted column by column, using vectorized operations wherever possible.
+
+        .. code-block:: python
+
+            >>> df.pipe(to_native_records)
+            [{'int': 1, 'float': None, 'date': datetime.datetime(2018, 12, 3, 0, 0)}, ...]
+
+        :param dataframe: The DataFrame object to work on.
+        :type dataframe: :class:`DataFrame <pandas.DataFrame>`
+        :param into: The mapping class of the records.
+
+        :returns: The records
+        :rtype: :class:`list`
+    """
+    columns = _native_columns(dataframe)
+    labels = dataframe.columns.tolist()
+    if not columns:
+        return [into() for _ in range(len(dataframe.index))]
+    return list(map(into, map(zip, repeat(labels), zip(*columns))))
+
+
+@instrumented
+def from_native_records(records, schema):
+    """
+        Builds a DataFrame from records holding native python types, the reverse of
+        :func:`to_native_records`. Every column gets the dtype declared in ``schema`` straight
+        away: numeric and boolean values are converted directly to arrays of their final dtype,
+        without an intermediate object column or a second conversion pass. Missing keys
+        and ``None`` values are nulls. Integer and boolean columns having nulls become
+        nullable (``Int64``, ``boolean``, ...) columns. Naive datetimes are localized to the
+        time zone of a time zone aware dtype, aware ones are converted to it.
+
+        .. code-block:: python
+
+            >>> records = [
+            ...     {'id': 1, 'score': 0.5, 'created': datetime(2018, 12, 3)},
+            ...     {'id': 2, 'score': None},
+            ... ]
+            >>> from_native_records(
+            ...     records, {'id': 'int32', 'score': 'float32', 'created': 'datetime64[ns]'}
+            ... ).dtypes
+            id                  int32
+            score             float32
+            created    datetime64[ns]
+            dtype: object
+
+        :param records: Iterable of :class:`dicts <dict>`. Each column is collected in a
+                        separate pass, so other iterables than lists are consumed into a list.
+        :param dict schema: Column names as keys and dtypes as values, in the order of the
+                            columns.
+
+        :returns: The DataFrame
+        :rtype: :class:`DataFrame <pandas.DataFrame>`
+
+        :raises: :exc:`ValueError` if an integer column has values that are not integers.
+    """
+    records = records if isinstance(records, (list, tuple)) else list(records)
+    return pd.DataFrame(
+        {column: _typed_array([record.get(column) for record in records], dtype)
+         for column, dtype in schema.items()},
+        columns=list(schema), index=pd.RangeIndex(len(records))
+    )
+
+
+def _typed_array(values, dtype):
+    """
+        Converts the sequence of native ``values`` to an array of ``dtype``, ``None`` being null.
+    """
+    dtype = ptypes.pandas_dtype(dtype)
+    numpy_dtype = dtype if isinstance(dtype, np.dtype) else getattr(dtype, 'numpy_dtype', None)
+    if numpy_dtype is not None and numpy_dtype.kind in 'iufb':
+        mask = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+        if mask.any():
+            fill_value = np.nan if numpy_dtype.kind == 'f' else 0
+            values = [fill_value if value is None else value for value in values]
+        data = np.array(values, dtype=numpy_dtype)
+        if numpy_dtype.kind in 'iu' and any(isinstance(value, float) for value in values) and \
+                not np.array_equal(data, np.array(values, dtype=np.float64)):
+            raise ValueError(f'The values are not integers, they do not fit into {dtype}.')
+        if dtype is not numpy_dtype:
+            return dtype.construct_array_type()(data, mask)
+        if numpy_dtype.kind in 'iub' and mask.any():
+            return pd.arrays.BooleanArray(data, mask) if numpy_dtype.kind == 'b' else \
+                pd.arrays.IntegerArray(data, mask)
+        return data
+    if isinstance(dtype, np.dtype) and dtype.kind in 'mM':
+        return np.array(values, dtype=dtype)
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return _localized_array(values, dtype)
+    if ptypes.is_object_dtype(dtype):
+        data = np.empty(len(values), dtype=object)
+        data[:] = values
+        return data
+    return pd.array(list(values), dtype=dtype)
+
+
+def _localized_array(values, dtype):
+    """
+        Converts the sequence of native datetime ``values`` to an array of the time zone aware
+        ``dtype``. Naive values are local times of the time zone, aware ones are converted.
+    """
+    try:
+        parsed = pd.DatetimeIndex(pd.to_datetime(list(values)))
+    except (TypeError, ValueError):  # Mixed naive and aware values or time zones
+        parsed = None
+    if parsed is None:
+        return pd.DatetimeIndex([
+            stamp.tz_localize(dtype.tz) if stamp.tzinfo is None else stamp.tz_convert(dtype.tz)
+            for stamp in map(pd.Timestamp, values)
+        ], dtype=dtype).array
+    if parsed.tz is None:
+        return parsed.tz_localize(dtype.tz).array
+    return parsed.tz_convert(dtype.tz).array
+
+
+def iter_native_rows(dataframe, chunk_size=10000, as_tuples=True):
+    """
+        Iterates over ``dataframe`` in chunks of ``chunk_size`` rows and yields the rows of each
+        chunk holding native python types only, with the same conversions as
+        :func:`to_native_records`. Only one chunk is converted at a time, so it is suitable
+        for bulk inserts of large DataFrames into databases.
+
+        .. code-block:: python
+
+            >>> for rows in df.pipe(iter_native_rows, 5000):
+            ...     cursor.executemany('INSERT INTO samples VALUES (?, ?, ?)', rows)
+
+        :param dataframe: The DataFrame object to work on.
+        :type dataframe: :class:`DataFrame <pandas.DataFrame>`
+        :param int chunk_size: The number of rows in a chunk.
+        :param bool as_tuples: Whether to yield the rows as :class:`tuples <tuple>`, in the
+                               order of the columns, or as :class:`dicts <dict>`.
+
+        :returns: Generator of the lists of rows
+        :rtype: :class:`generator`
+
+        :raises: :exc:`ValueError`
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer.')
+    for start in range(0, len(dataframe.index), chunk_size):
+        chunk = dataframe.iloc[start:start + chunk_size]
+        if not as_tuples:
+            yield to_native_records(chunk)
+        elif len(chunk.columns):
+            yield list(zip(*_native_columns(chunk)))
+        else:
+            yield [() for _ in range(len(chunk.index))]
+
+
+def _native_columns(dataframe):
+    """
+        Converts every column of ``dataframe`` to a list of native python values.
+    """
+    return [_native_column(dataframe.iloc[:, position])
+            for position in range(len(dataframe.columns))]
+
+
+def _native_column(series):
+    """
+        Converts ``series`` to a list of native python values, with ``None`` for nulls.
+    """
+    values = _column_converter(series.dtype)(series)
+    mask = series.isna().to_numpy()
+    if mask.any():
+        for position in np.flatnonzero(mask):
+            values[position] = None
+    return values
+
+
+def _column_converter(dtype):
+    """
+        Returns the function converting a whole column of ``dtype`` to a list, resolved only
+        once per dtype.
+    """
+    try:
+        return _RESOLVED_COLUMN_CONVERTERS[dtype]
+    except KeyError:
+        pass
+    converter = _DTYPE_CONVERTERS.get(dtype, _DTYPE_CONVERTERS.get(type(dtype)))
+    if converter is not None:
+        def convert(series):
+            return [None if null else converter(value) for value, null
+                    in zip(series.astype(object).tolist(), series.isna().to_numpy())]
+    elif ptypes.is_datetime64_any_dtype(dtype):
+        def convert(series):
+            return list(series.dt.to_pydatetime())
+    elif ptypes.is_timedelta64_dtype(dtype):
+        def convert(series):
+            return list(series.dt.to_pytimedelta())
+    elif isinstance(dtype, np.dtype) and dtype.kind in 'iufb':
+        def convert(series):
+            return series.tolist()
+    else:
+        def convert(series):
+            return [
+                _value_converter(type(value))(value) for value in series.astype(object).tolist()
+            ]
+    _RESOLVED_COLUMN_CONVERTERS[dtype] = convert
+    return convert
 
 
-def clear_nan(dataframe):
+@instrumented
+def clear_nan(dataframe, inplace=False, n_threads=1):
     """
-        Change the pandas.NaT and the pandas.nan elements to None.
+        Change the pandas.NaT and the pandas.nan elements to None. Only the columns containing
+        null values are converted to object, the rest are left untouched and are not copied.
 
         :param dataframe: The pandas.DataFrame object which should be transformed
+        :param bool inplace: Whether to modify *dataframe* itself instead of a shallow copy.
+        :param int n_threads: Number of threads to convert the columns with.
         :return: The modified *dataframe*
     """
-    dataframe = dataframe.replace([pd.NaT], [None])
-    return dataframe.where(pd.notnull(dataframe), None)
+    if not inplace:
+        dataframe = dataframe.copy(deep=False)
+    columns = list(dataframe.columns)
+    cleared = _map_threaded(
+        _clear_column, [dataframe[column] for column in columns], n_threads=n_threads
+    )
+    for column, series in zip(columns, cleared):
+        if series is not None:
+            _set_column(dataframe, column, series)
+    return dataframe
+
+
+def _clear_column(series):
+    """
+        Returns ``series`` as object column with ``None`` instead of null values, or ``None`` if
+        it contains no null values.
+    """
+    mask = series.isna().to_numpy()
+    if not mask.any():
+        return None
+    # to_numpy(dtype=object) returns integer nanoseconds for datetime columns on pandas 1.0
+    values = series.astype(object).to_numpy(copy=True)
+    values[mask] = None
+    return pd.Series(values, index=series.index, dtype=object)
+
+
+class DatetimeCache:
+    """
+        Bounded LRU cache of parsed date values, to be shared between
+        :func:`convert_to_type` calls, e.g. when converting a large dataset batch by batch.
+        Values are cached together with the keyword arguments they were parsed with.
+        The cache can be shared between threads.
+
+        .. code-block:: python
+
+            >>> cache = DatetimeCache(maxsize=10000)
+            >>> for batch in batches:
+            ...     batch.pipe(convert_to_type, {'date': 'created'}, date_cache=cache)
+
+        :param int maxsize: The maximum number of parsed values kept in the cache.
+    """
+    def __init__(self, maxsize=100000):
+        self.maxsize = maxsize
+        self._parsed = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._parsed)
+
+    @instrumented
+    def parse(self, values, **kwargs):
+        """
+            Parses ``values`` with :func:`to_datetime() <pandas.to_datetime>`. Only the values
+            missing from the cache are parsed, in a single call.
+
+            :param values: The values to parse, preferably without duplications.
+            :param kwargs: Keyword arguments of :func:`to_datetime() <pandas.to_datetime>`.
+
+            :returns: The parsed values
+            :rtype: :class:`DatetimeIndex <pandas.DatetimeIndex>`
+        """
+        options = tuple(sorted(kwargs.items()))
+        keys = [(options, value) for value in values]
+        with self._lock:
+            missing = [key for key in keys if key not in self._parsed]
+            if missing:
+                parsed = pd.to_datetime(pd.Index([value for _, value in missing]), **kwargs)
+                self._parsed.update(zip(missing, parsed))
+            result = pd.DatetimeIndex([self._parsed[key] for key in keys])
+            if result.isna().all():
+                # Without a single Timestamp, the time zone has to come from the options.
+                dtype = pd.to_datetime(pd.Index([], dtype=object), **kwargs).dtype
+                result = pd.DatetimeIndex(result, dtype=dtype)
+            for key in keys:
+                self._parsed.move_to_end(key)
+            while len(self._parsed) > self.maxsize:
+                self._parsed.popitem(last=False)
+        return result
 
 
-def convert_to_type(dataframe, mapper, *types, kwargs_map=None):
+@instrumented
+def convert_to_type(dataframe, mapper, *types, kwargs_map=None, date_cache=None, n_threads=1,
+                    inplace=False):
     r"""
         Converts columns to types specified by the ``mapper``. In case of ``integer``, ``float``,
         ``signed`` and ``unsigned`` typecasting, the smallest possible type will be chosen. See
-        more details at :func:`to_numeric() <pandas.to_numeric>`.
+        more details at :func:`to_numeric() <pandas.to_numeric>`. Every column is converted
+        with a single call on the whole column, so the downcast type is chosen for the column as
+        a whole. Columns already having the target type are left untouched.
 
         .. code-block:: python
 
@@ -80,7 +531,7 @@ def convert_to_type(dataframe, mapper, *types, kwargs_map=None):
             date        datetime64[ns]
             datetime    datetime64[ns]
             number             float64
-            int                  int64
+            int                  int16
             float              float32
             object              object
             dtype: object
@@ -96,38 +547,298 @@ def convert_to_type(dataframe, mapper, *types, kwargs_map=None):
                                 :func:`to_datetime() <pandas.to_datetime>` or
                                 :func:`to_numeric() <pandas.to_numeric>`.
                                 Keys must be the column names, values are the kwargs dict.
+                                An explicit ``format`` avoids the format inference of dates.
+        :param date_cache: If ``True``, date columns are factorized and only their unique values
+                           are parsed, which is much faster for columns with few distinct values.
+                           A :class:`DatetimeCache` instance does the same and also keeps the
+                           parsed values for later calls.
+        :type date_cache: :class:`bool` or :class:`DatetimeCache`
+        :param int n_threads: Number of threads to convert the columns with. The converted
+                              columns are assigned to ``dataframe`` when all are done.
+        :param bool inplace: Whether to modify ``dataframe`` itself instead of a shallow copy.
 
         :returns: The converted dataframe
         :rtype: :class:`DataFrame <pandas.DataFrame>`
     """
-    types = types or mapper.keys()
-    kwargs_map = kwargs_map or {}
-    for _type in types:
-        if isinstance(mapper[_type], list):
-            type_list = mapper[_type]
-        else:
-            type_list = [mapper[_type]]
-        for column in type_list:
-            if column in list(dataframe):
-                kwargs = kwargs_map.get(column, {})
-                if _type == 'number':
-                    dataframe[column] = dataframe[column].apply(
-                        pd.to_numeric, errors='coerce', **kwargs
-                    )
-                elif _type in ('date', 'datetime'):
-                    dataframe[column] = dataframe[column].apply(
-                        pd.to_datetime, errors='coerce', utc=True, **kwargs
-                    )
-                elif _type in ('integer', 'float', 'signed', 'unsigned'):
-                    dataframe[column] = dataframe[column].apply(
-                        pd.to_numeric, errors='coerce', downcast=_type
-                    )
-    return dataframe
+    return ConversionPlan(mapper, *types, kwargs_map=kwargs_map, date_cache=date_cache).\
+        apply(dataframe, n_threads=n_threads, inplace=inplace)
+
+
+class ConversionPlan:
+    r"""
+        Reusable form of :func:`convert_to_type`, for converting many DataFrames, e.g. batches
+        of the same dataset, the same way. The column lookups are resolved only once. After
+        :meth:`fit`, the output dtypes are pinned, so every converted DataFrame gets exactly the
+        same dtypes regardless of the downcast its own values would allow. Integer columns are
+        pinned to the nullable integer dtype twice as wide as the fitted values need, so later
+        batches may have missing values and somewhat larger numbers.
+
+        .. code-block:: python
+
+            >>> plan = ConversionPlan({'integer': 'int', 'date': 'created'}).fit(first_batch)
+            >>> plan.dtypes
+            {'int': Int32Dtype(), 'created': datetime64[ns, UTC]}
+            >>> converted = [batch.pipe(plan) for batch in batches]
+
+        :param dict mapper: Same as at :func:`convert_to_type`.
+        :param str \*types: Same as at :func:`convert_to_type`.
+        :param dict kwargs_map: Same as at :func:`convert_to_type`.
+        :param date_cache: Same as at :func:`convert_to_type`.
+    """
+    def __init__(self, mapper, *types, kwargs_map=None, date_cache=None):
+        kwargs_map = kwargs_map or {}
+        self.date_cache = date_cache
+        self.dtypes = {}
+        self._conversions = OrderedDict()
+        for _type in types or mapper.keys():
+            for column in mapper[_type] if isinstance(mapper[_type], list) else [mapper[_type]]:
+                self._conversions.setdefault(column, []).append(
+                    (_type, kwargs_map.get(column, {}))
+                )
+        self.columns = list(self._conversions)
+
+    def __call__(self, dataframe):
+        return self.apply(dataframe)
+
+    @instrumented
+    def fit(self, dataframe):
+        """
+            Pins the output dtypes to the ones the conversion of ``dataframe`` results in.
+            Fitting more DataFrames widens the pinned dtypes to fit all of them.
+            ``dataframe`` itself is not modified.
+
+            :param dataframe: A representative DataFrame, e.g. the first batch.
+            :type dataframe: :class:`DataFrame <pandas.DataFrame>`
+
+            :returns: The plan itself
+            :rtype: :class:`ConversionPlan`
+        """
+        columns = set(self.columns) & set(dataframe.columns)
+        pinned, self.dtypes = self.dtypes, {}
+        converted = self.apply(dataframe[[col for col in dataframe.columns if col in columns]])
+        for column in columns:
+            dtype = converted[column].dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in 'iu':
+                dtype = _nullable_integer(np.dtype(f'{dtype.kind}{min(dtype.itemsize * 2, 8)}'))
+            previous = getattr(pinned.get(column), 'numpy_dtype', pinned.get(column))
+            current = getattr(dtype, 'numpy_dtype', dtype)
+            if isinstance(previous, np.dtype) and isinstance(current, np.dtype):
+                dtype = np.promote_types(previous, current)
+                if dtype.kind in 'iu':
+                    dtype = _nullable_integer(dtype)
+            self.dtypes[column] = dtype
+        return self
+
+    @instrumented
+    def apply(self, dataframe, n_threads=1, inplace=False):
+        """
+            Converts the columns of ``dataframe``, then casts them to the pinned dtypes, if the
+            plan was fitted.
+
+            :param dataframe: The DataFrame object to work on.
+            :type dataframe: :class:`DataFrame <pandas.DataFrame>`
+            :param int n_threads: Number of threads to convert the columns with.
+            :param bool inplace: Whether to modify ``dataframe`` itself instead of a shallow
+                                 copy.
+
+            :returns: The converted dataframe
+            :rtype: :class:`DataFrame <pandas.DataFrame>`
+
+            :raises: :exc:`ValueError` if the values do not fit the pinned dtype.
+        """
+        if not inplace:
+            dataframe = dataframe.copy(deep=False)
+        columns = [column for column in self.columns if column in dataframe.columns]
+        originals = [dataframe[column] for column in columns]
+        converted = _map_threaded(self.convert_series, originals, n_threads=n_threads)
+        for column, original, series in zip(columns, originals, converted):
+            if series is not original:
+                _set_column(dataframe, column, series)
+        return dataframe
+
+    def convert_series(self, series):
+        """
+            Converts a single column with the conversions of the column named like ``series``,
+            then casts it to its pinned dtype.
+
+            :param series: The column to convert.
+            :type series: :class:`Series <pandas.Series>`
 
+            :returns: The converted column
+            :rtype: :class:`Series <pandas.Series>`
+        """
+        for _type, kwargs in self._conversions.get(series.name, ()):
+            series = _convert_column(series, _type, kwargs, self.date_cache)
+        dtype = self.dtypes.get(series.name)
+        if dtype is not None and not ptypes.is_dtype_equal(series.dtype, dtype):
+            series = _cast_pinned(series, dtype)
+        return series
+
+
+def _nullable_integer(dtype):
+    """
+        Returns the nullable integer dtype of the numpy integer ``dtype``.
+    """
+    return ptypes.pandas_dtype(f"{'U' if dtype.kind == 'u' else ''}Int{dtype.itemsize * 8}")
+
+
+def _cast_pinned(series, dtype):
+    """
+        Casts ``series`` to the pinned ``dtype``, making sure no values are lost when casting
+        to a numeric dtype.
+    """
+    numpy_dtype = getattr(dtype, 'numpy_dtype', dtype)
+    if not (isinstance(numpy_dtype, np.dtype) and numpy_dtype.kind in 'iuf' and len(series)) or \
+            isinstance(series.dtype, np.dtype) and np.can_cast(series.dtype, numpy_dtype):
+        return series.astype(dtype)
+    values = series.dropna()
+    if numpy_dtype.kind == 'f':
+        with np.errstate(over='ignore'):
+            lossless = np.allclose(values.astype(numpy_dtype), values, rtol=0)
+        if not lossless:
+            raise ValueError(f'Values of column {series.name} do not fit into {dtype} without '
+                             f'loss.')
+        return series.astype(dtype)
+    if len(values) < len(series) and isinstance(dtype, np.dtype):
+        raise ValueError(f'Column {series.name} has missing values, which do not fit into {dtype}.')
+    limits = np.iinfo(numpy_dtype)
+    if len(values) and (values.min() < limits.min or values.max() > limits.max):
+        raise ValueError(f'Values of column {series.name} do not fit into {dtype}.')
+    if values.dtype.kind == 'f' and not (np.trunc(values) == values).all():
+        raise ValueError(f'Values of column {series.name} are not integers, they do not fit into '
+                         f'{dtype}.')
+    return series.astype(dtype)
+
+
+def _convert_column(series, _type, kwargs, date_cache=None):
+    """
+        Converts ``series`` with a single call to the proper pandas converter. Columns that
+        already have the target dtype are returned unchanged.
+    """
+    if _type == 'number':
+        # Numeric columns are kept, unless the keyword arguments change the dtype.
+        if ptypes.is_numeric_dtype(series.dtype) and not ptypes.is_bool_dtype(series.dtype) \
+                and all(kwargs.get(key) is None for key in ('downcast', 'dtype_backend')):
+            return series
+        return pd.to_numeric(series, errors='coerce', **kwargs)
+    if _type in ('date', 'datetime'):
+        if isinstance(series.dtype, pd.DatetimeTZDtype) and str(series.dt.tz) == 'UTC':
+            return series
+        if not any(key in kwargs for key in ('format', 'unit', 'infer_datetime_format')):
+            kwargs = dict(_DATETIME_DEFAULTS, **kwargs)
+        if date_cache is True or isinstance(date_cache, DatetimeCache):
+            return _parse_unique_dates(
+                series, None if date_cache is True else date_cache,
+                errors='coerce', utc=True, **kwargs
+            )
+        return pd.to_datetime(series, errors='coerce', utc=True, **kwargs)
+    if _type in ('integer', 'float', 'signed', 'unsigned'):
+        return pd.to_numeric(series, errors='coerce', downcast=_type)
+    return series
+
+
+def _parse_unique_dates(series, date_cache, **kwargs):
+    """
+        Parses only the unique values of ``series`` and broadcasts them back to the rows.
+    """
+    codes, uniques = pd.factorize(series)
+    if date_cache is None:
+        parsed = pd.DatetimeIndex(pd.to_datetime(uniques, **kwargs))
+    else:
+        parsed = date_cache.parse(uniques, **kwargs)
+    return pd.Series(
+        parsed.take(codes, allow_fill=True, fill_value=pd.NaT), index=series.index,
+        name=series.name
+    )
+
+
+@instrumented
+def optimize_memory(dataframe, categorical_threshold=0.05, downcast_floats=True, report=False,
+                    inplace=False):
+    """
+        Shrinks the memory footprint of every column with the smallest dtype that holds its
+        values without loss. Integers are downcast the way :func:`convert_to_type` does,
+        floats are stored as ``float32`` if no precision is lost, and object columns with few
+        distinct values become categorical. Other dtypes are left untouched.
+
+        .. code-block:: python
+
+            >>> df = pd.DataFrame({
+            ...     'flag': [0, 1, 1, 0] * 1000,
+            ...     'ratio': [0.5, 0.25, 1.0, 2.0] * 1000,
+            ...     'status': ['open', 'closed', 'open', 'open'] * 1000,
+            ... })
+            >>> df, report = df.pipe(optimize_memory, report=True)
+            >>> report
+                   dtype_before dtype_after  bytes_before  bytes_after
+            flag          int64       uint8         32000         4000
+            ratio       float64     float32         32000        16000
+            status       object    category        246000         4232
 
-def truncate_strings(dataframe, length_mapping):
+        :param dataframe: The DataFrame object to work on.
+        :type dataframe: :class:`DataFrame <pandas.DataFrame>`
+        :param float categorical_threshold: Object columns are converted to categorical if the
+                                            ratio of distinct values to rows is at most this.
+        :param bool downcast_floats: Whether floats may be stored as ``float32``.
+        :param bool report: Whether to return a report of the dtypes and memory usage of the
+                            columns before and after the optimization as well.
+        :param bool inplace: Whether to modify ``dataframe`` itself instead of a shallow copy.
+
+        :returns: The optimized dataframe, and the report if requested
+        :rtype: :class:`DataFrame <pandas.DataFrame>` or :class:`tuple`
+    """
+    if not inplace:
+        dataframe = dataframe.copy(deep=False)
+    dtypes_before = dataframe.dtypes
+    bytes_before = dataframe.memory_usage(index=False, deep=True)
+    for column in dataframe.columns:
+        series = dataframe[column]
+        optimized = _optimize_column(series, categorical_threshold, downcast_floats)
+        if optimized is not series:
+            _set_column(dataframe, column, optimized)
+    if not report:
+        return dataframe
+    return dataframe, pd.DataFrame({
+        'dtype_before': dtypes_before,
+        'dtype_after': dataframe.dtypes,
+        'bytes_before': bytes_before,
+        'bytes_after': dataframe.memory_usage(index=False, deep=True),
+    })
+
+
+def _optimize_column(series, categorical_threshold, downcast_floats):
+    """
+        Returns ``series`` converted to the smallest lossless dtype, or ``series`` itself.
+    """
+    dtype = series.dtype
+    if series.empty or not isinstance(dtype, np.dtype) or ptypes.is_bool_dtype(dtype):
+        return series
+    if ptypes.is_integer_dtype(dtype):
+        return pd.to_numeric(series, downcast='unsigned' if series.min() >= 0 else 'integer')
+    if ptypes.is_float_dtype(dtype):
+        if downcast_floats and dtype.itemsize > 4:
+            values = series.to_numpy()
+            with np.errstate(over='ignore'):
+                narrowed = values.astype(np.float32)
+            if np.array_equal(narrowed, values, equal_nan=True):
+                return series.astype(np.float32)
+        return series
+    if ptypes.is_object_dtype(dtype):
+        try:
+            distinct = series.nunique(dropna=False)
+        except TypeError:
+            return series
+        if distinct <= categorical_threshold * len(series):
+            return series.astype('category')
+    return series
+
+
+@instrumented
+def truncate_strings(dataframe, length_mapping, unit='chars', n_threads=1, inplace=False):
     r"""
-        Truncates strings in columns to defined length.
+        Truncates strings in columns to defined length. Values other than strings are left
+        untouched. Categorical columns are truncated by their categories, merging categories
+        that become equal.
 
         .. code-block:: python
 
@@ -153,13 +864,64 @@ def truncate_strings(dataframe, length_mapping):
         :param dataframe: The DataFrame object to work on.
         :type dataframe: :class:`DataFrame <pandas.DataFrame>`
         :param dict length_mapping: Dict of column names and desired length
+        :param str unit: Either ``chars`` to limit the number of characters, or ``bytes`` to
+                         limit the length of the UTF-8 encoded strings. Multi-byte characters
+                         are never split.
+        :param int n_threads: Number of threads to truncate the columns with.
+        :param bool inplace: Whether to modify ``dataframe`` itself instead of a shallow copy.
 
         :returns: The converted dataframe
         :rtype: :class:`DataFrame <pandas.DataFrame>`
+
+        :raises: :exc:`ValueError`
     """
-    for colname, length in length_mapping.items():
-        if colname in list(dataframe):
-            dataframe[colname] = dataframe[colname].apply(
-                lambda x, max_len=length: x[:max_len] if isinstance(x, str) else x
-            )
+    if not inplace:
+        dataframe = dataframe.copy(deep=False)
+    if unit not in ('chars', 'bytes'):
+        raise ValueError('Improper value for parameter unit. Possible values: chars, bytes.')
+    columns = [colname for colname in length_mapping if colname in dataframe.columns]
+    truncated = _map_threaded(
+        _truncate_column, [dataframe[colname] for colname in columns],
+        [length_mapping[colname] for colname in columns], repeat(unit), n_threads=n_threads
+    )
+    for colname, series in zip(columns, truncated):
+        _set_column(dataframe, colname, series)
     return dataframe
+
+
+def _truncate_column(series, length, unit):
+    """
+        Truncates the values or, if ``series`` is categorical, the categories of ``series``.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return _truncate_categories(series, length, unit)
+    return _truncate(series, length, unit)
+
+
+def _truncate(series, length, unit):
+    """
+        Truncates the strings in ``series`` with the vectorized string methods.
+    """
+    try:
+        if unit == 'bytes':
+            truncated = series.str.encode('utf-8').str.slice(0, length).\
+                str.decode('utf-8', errors='ignore').astype(series.dtype)
+        else:
+            truncated = series.str.slice(0, length)
+    except AttributeError:
+        return series
+    return truncated.where(truncated.notna(), series)
+
+
+def _truncate_categories(series, length, unit):
+    """
+        Truncates the categories of the categorical ``series``, merging the duplicates.
+    """
+    categories = _truncate(pd.Series(series.cat.categories, dtype=object), length, unit)
+    mapping, categories = pd.factorize(categories)
+    codes = series.cat.codes.to_numpy()
+    codes = np.where(codes >= 0, mapping[codes], -1)
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=categories, ordered=series.cat.ordered),
+        index=series.index, name=series.name
+    )
@@ -3,9 +3,11 @@
 """
 import re
 
+from .instrumentation import instrumented
 from .transformations import merge_columns
 
 
+@instrumented
 def flatten_adjacency_list(dataframe, parent, right_on=None):
     """
         Creates the flattened hierarchy out of an adjancecy list.
@@ -76,6 +78,7 @@ def flatten_adjacency_list(dataframe, parent, right_on=None):
     return dataframe.drop(rename_map[parent], axis=1)
 
 
+@instrumented
 def get_adjacency_list_depth(dataframe, parent, right_on=None, new_column='depth'):
     """
         Calculates node depth in the adjancecy list hierarchy.
@@ -129,5 +132,7 @@ def get_adjacency_list_depth(dataframe, parent, right_on=None, new_column='depth
     """
     dataframe = dataframe.pipe(flatten_adjacency_list, parent, right_on=right_on)
     columns = [col for col in dataframe.columns.tolist() if re.match(parent + r'(_\d)?', col)]
-    dataframe = dataframe.pipe(merge_columns, columns, new_column, aggr=lambda x: x.notna().sum())
+    dataframe = dataframe.pipe(
+        merge_columns, columns, new_column, aggr=lambda x: x.notna().sum(), inplace=True
+    )
     return dataframe.drop([col for col in columns if col != parent], axis=1)
@@ -0,0 +1,191 @@
+"""
+    Contains the opt-in instrumentation of the public functions. Every call of a public function
+    is reported to the registered callbacks as a :class:`CallEvent`. Without callbacks, the
+    functions are called directly, without measuring anything.
+"""
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import wraps
+
+import pandas as pd
+
+_CALLBACKS = []
+_TRACING = {'callbacks': 0, 'started': False}
+_CALLS = threading.local()
+
+
+class CallEvent(namedtuple('CallEvent', [
+        'function', 'rows_in', 'columns_in', 'rows_out', 'columns_out', 'seconds',
+        'allocated_bytes', 'nested'])):
+    """
+        Report of a single call of a public function. Row and column counts are ``None`` if
+        the input or output is not tabular. ``allocated_bytes`` is the peak of the memory
+        allocated during the call, if memory is traced, ``None`` otherwise. ``nested`` is
+        ``True`` if the function was called by another public function, e.g.
+        :meth:`ConversionPlan.apply` by :func:`convert_to_type`. Its time and memory are
+        included in the event of the outer call, so only the events that are not nested
+        should be summed. Use :meth:`_asdict` to forward the event as a dict.
+    """
+    __slots__ = ()
+
+
+def add_callback(callback, trace_memory=False):
+    """
+        Registers ``callback`` to be called with a :class:`CallEvent` after every call of a
+        public function.
+
+        :param callable callback: The callback getting the events.
+        :param bool trace_memory: Whether to trace the allocated memory with :mod:`tracemalloc`
+                                  while ``callback`` is registered. Tracing slows the calls down.
+    """
+    _CALLBACKS.append((callback, trace_memory))
+    if trace_memory:
+        _TRACING['callbacks'] += 1
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _TRACING['started'] = True
+
+
+def remove_callback(callback):
+    """
+        Unregisters ``callback``. Memory tracing is stopped, if it was started for the
+        callbacks and no other callback needs it.
+
+        :param callable callback: A callback registered with :func:`add_callback`.
+
+        :raises: :exc:`ValueError` if ``callback`` is not registered.
+    """
+    for index, (registered, trace_memory) in enumerate(_CALLBACKS):
+        if registered == callback:
+            del _CALLBACKS[index]
+            break
+    else:
+        raise ValueError('The callback is not registered.')
+    if trace_memory:
+        _TRACING['callbacks'] -= 1
+        if not _TRACING['callbacks'] and _TRACING['started']:
+            tracemalloc.stop()
+            _TRACING['started'] = False
+
+
+@contextmanager
+def instrument(callback=None, trace_memory=False):
+    """
+        Reports the calls of the public functions within the ``with`` block.
+
+        .. code-block:: python
+
+            >>> with instrument() as events:
+            ...     df = df.pipe(expand_list, 'samples').pipe(clear_nan)
+            >>> events[0]
+            CallEvent(function='expand_list', rows_in=6, columns_in=3, rows_out=12, ...)
+            >>> with instrument(lambda event: statsd.timing(event.function, event.seconds)):
+            ...     df = df.pipe(expand_list, 'samples')
+
+        :param callable callback: The callback getting the events. By default, the events are
+                                  collected into the list returned by the context manager.
+        :param bool trace_memory: Same as at :func:`add_callback`.
+
+        :returns: The list of collected events, which is empty if ``callback`` is given.
+        :rtype: :class:`list`
+    """
+    events = []
+    callback = callback or events.append
+    add_callback(callback, trace_memory)
+    try:
+        yield events
+    finally:
+        remove_callback(callback)
+
+
+def instrumented(func):
+    """
+        Decorates a public function to report its calls to the registered callbacks.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _CALLBACKS:
+            return func(*args, **kwargs)
+        return _report(func, args, kwargs)
+    return wrapper
+
+
+def _report(func, args, kwargs):
+    """
+        Calls ``func`` and reports the call to every registered callback.
+    """
+    source = next((arg for arg in args if isinstance(arg, pd.DataFrame)), args[0] if args else None)
+    rows_in, columns_in = _shape(source)
+    depth = getattr(_CALLS, 'depth', 0)
+    before = _start_tracing()
+    start = time.perf_counter()
+    _CALLS.depth = depth + 1
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        _CALLS.depth = depth
+        seconds = time.perf_counter() - start
+        allocated = _stop_tracing(before)
+    rows_out, columns_out = _shape(result[0] if isinstance(result, tuple) and result else result)
+    event = CallEvent(
+        func.__qualname__, rows_in, columns_in, rows_out, columns_out, seconds, allocated,
+        depth > 0
+    )
+    for callback, _ in list(_CALLBACKS):
+        callback(event)
+    return result
+
+
+def _start_tracing():
+    """
+        Returns the currently traced memory and resets the peak, or ``None`` if memory is not
+        traced. The peak reached so far by the calling function is kept before the reset.
+    """
+    if not (tracemalloc.is_tracing() and any(trace for _, trace in _CALLBACKS)):
+        return None
+    peaks = _peaks()
+    if peaks:
+        peaks[-1] = max(peaks[-1], tracemalloc.get_traced_memory()[1])
+    peaks.append(0)
+    if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+
+        tracemalloc.reset_peak()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _stop_tracing(before):
+    """
+        Returns the peak of the memory allocated since :func:`_start_tracing` returned
+        ``before``. Nested calls reset the peak, so they pass their own peak to the caller.
+    """
+    if before is None or not tracemalloc.is_tracing():
+        return None
+    peaks = _peaks()
+    peak = max(tracemalloc.get_traced_memory()[1], peaks.pop())
+    if peaks:
+        peaks[-1] = max(peaks[-1], peak)
+    return peak - before
+
+
+def _peaks():
+    """
+        Returns the stack of the memory peaks of the calls in progress in the current thread.
+    """
+    if not hasattr(_CALLS, 'peaks'):
+        _CALLS.peaks = []
+    return _CALLS.peaks
+
+
+def _shape(value):
+    """
+        Returns the number of rows and columns of ``value``, or ``None`` for the unknown ones.
+    """
+    if isinstance(value, pd.DataFrame):
+        return value.shape
+    if isinstance(value, (pd.Series, pd.Index)):
+        return len(value), 1
+    if isinstance(value, (list, tuple)):
+        return len(value), None
+    return None, None
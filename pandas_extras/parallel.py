@@ -0,0 +1,136 @@
+"""
+    Contains functions to run transformations on multiple cores.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .instrumentation import instrumented
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # Python < 3.8
+    SharedMemory = None
+
+
+@instrumented
+def parallel_pipe(dataframe, func, *args, n_workers=None, partitions=None, **kwargs):
+    """
+        Splits ``dataframe`` into row ranges and calls ``func`` on each of them in a process
+        pool. The results are concatenated in the original order of the rows.
+
+        Numeric, boolean and datetime columns are passed to the workers through shared memory
+        instead of being pickled, if :mod:`multiprocessing.shared_memory` is available.
+
+        .. code-block:: python
+
+            >>> df.pipe(parallel_pipe, extract_dictionary, 'samples', n_workers=8)
+
+        .. warning::
+            ``func`` must be row-local, i.e. the result of a row may not depend on other rows,
+            and it must be picklable, like functions defined at module level.
+
+        :param dataframe: The DataFrame object to work on.
+        :type dataframe: :class:`DataFrame <pandas.DataFrame>`
+        :param callable func: The function to call on the partitions. Called like
+                              ``func(partition, *args, **kwargs)``.
+        :param int n_workers: Number of worker processes. Defaults to the number of CPUs.
+        :param int partitions: Number of row ranges to split the DataFrame into. Defaults to
+                               ``n_workers``.
+
+        :returns: The concatenated results of ``func``
+        :rtype: :class:`DataFrame <pandas.DataFrame>`
+
+        :raises: :exc:`ValueError`
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if partitions is None:
+        partitions = n_workers
+    if n_workers < 1 or partitions < 1:
+        raise ValueError('n_workers and partitions must be positive')
+    bounds = np.unique(np.linspace(0, len(dataframe.index), partitions + 1).astype(int))
+    if len(bounds) < 3:
+        return func(dataframe, *args, **kwargs)
+    shared, layout, objects = _share_columns(dataframe)
+    try:
+        with ProcessPoolExecutor(max_workers=min(n_workers, len(bounds) - 1)) as executor:
+            results = list(executor.map(_run_partition, *zip(*(
+                (
+                    func, args, kwargs, shared.name if shared else None, layout,
+                    objects.iloc[start:stop], dataframe.columns, start, stop,
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ))))
+    finally:
+        if shared is not None:
+            shared.close()
+            shared.unlink()
+    return pd.concat(results)
+
+
+def _share_columns(dataframe):
+    """
+        Copies the numpy-backed numeric columns of ``dataframe`` into one shared memory block.
+        Returns the block, the layout of the shared columns as ``(position, dtype, offset)``
+        tuples, and a DataFrame with the remaining columns and the index.
+    """
+    positions = [
+        position for position, dtype in enumerate(dataframe.dtypes)
+        if isinstance(dtype, np.dtype) and dtype.kind in 'iufbmM'
+    ] if SharedMemory is not None else []
+    nbytes = sum(dataframe.dtypes.iloc[position].itemsize for position in positions) * \
+        len(dataframe.index)
+    if not nbytes:
+        return None, [], dataframe
+    shared = SharedMemory(create=True, size=nbytes)
+    layout, offset = [], 0
+    for position in positions:
+        values = dataframe.iloc[:, position].to_numpy()
+        np.ndarray(values.shape, values.dtype, buffer=shared.buf, offset=offset)[:] = values
+        layout.append((position, values.dtype.str, offset))
+        offset += values.nbytes
+    others = [position for position in range(len(dataframe.columns)) if position not in positions]
+    return shared, layout, dataframe.iloc[:, others]
+
+
+def _run_partition(func, args, kwargs, name, layout, objects, labels, start, stop):
+    """
+        Rebuilds the rows between ``start`` and ``stop`` in a worker process and calls ``func``
+        on them.
+    """
+    shared_positions = [position for position, _, _ in layout]
+    columns = dict(zip(
+        (position for position in range(len(labels)) if position not in shared_positions),
+        (objects.iloc[:, position] for position in range(len(objects.columns)))
+    ))
+    if layout:
+        shared = SharedMemory(name=name)
+        try:
+            for position, dtype, offset in layout:
+                dtype = np.dtype(dtype)
+                offset += start * dtype.itemsize
+                columns[position] = pd.Series(np.ndarray(
+                    (stop - start,), dtype, buffer=shared.buf, offset=offset
+                ).copy(), index=objects.index)
+        finally:
+            shared.close()
+    partition = pd.concat([columns[position] for position in range(len(labels))], axis=1) \
+        if labels.size else objects
+    partition.columns = labels
+    return func(partition, *args, **kwargs)
+
+
+def _map_threaded(func, *iterables, n_threads=1):
+    """
+        Maps ``func`` over ``iterables`` like :func:`map`, in a pool of ``n_threads`` threads.
+        With ``1`` or ``None`` thread, ``func`` is called in the current thread.
+    """
+    if n_threads is None or n_threads == 1:
+        return list(map(func, *iterables))
+    if n_threads < 1:
+        raise ValueError('n_threads must be positive')
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        return list(executor.map(func, *iterables))
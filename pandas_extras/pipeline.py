@@ -0,0 +1,284 @@
+"""
+    Contains a lazy pipeline to run chains of transformations with less copying.
+"""
+from functools import partial
+
+from .conversions import (
+    _clear_column, _truncate_column, ConversionPlan, clear_nan, convert_to_type, truncate_strings
+)
+from .instrumentation import instrumented
+from .transformations import _dict_key_column, _extract_keys, extract_dict_key, extract_dictionary
+from .util import _set_column
+
+
+class Pipeline:
+    """
+        Records a chain of transformations, and runs them on a DataFrame only when
+        :meth:`run` is called.
+
+        Consecutive column-wise steps, i.e. :func:`extract_dict_key`, :func:`extract_dictionary`
+        with a ``key_list``, :func:`convert_to_type`, :func:`truncate_strings`,
+        :func:`clear_nan` and :meth:`drop`, are fused:
+
+        * keys extracted from the same column are collected with a single pass over the column,
+        * the new and converted columns are kept aside and the DataFrame is built only once,
+          after the last fused step,
+        * columns that are dropped later are not computed, and they are released as soon as
+          no later step reads them.
+
+        Other functions are called as they are, like with :meth:`pipe() <pandas.DataFrame.pipe>`.
+
+        .. code-block:: python
+
+            >>> pipeline = Pipeline().\\
+            ...     pipe(extract_dictionary, 'samples', key_list=['A', 'B', 'C']).\\
+            ...     pipe(convert_to_type, {'integer': ['samples.A', 'samples.B']}).\\
+            ...     pipe(truncate_strings, {'samples.C': 10}).\\
+            ...     drop(['samples.B'])
+            >>> result = pipeline.run(df)
+    """
+    def __init__(self):
+        self._steps = []
+
+    def __call__(self, dataframe):
+        return self.run(dataframe)
+
+    def pipe(self, func, *args, **kwargs):
+        """
+            Records a call of ``func(dataframe, *args, **kwargs)``.
+
+            :param callable func: The function to call.
+
+            :returns: The pipeline itself
+            :rtype: :class:`Pipeline`
+        """
+        self._steps.append((func, args, kwargs))
+        return self
+
+    def drop(self, columns):
+        """
+            Records dropping ``columns``. Columns that do not exist are ignored.
+
+            :param list columns: The name of the columns to drop.
+
+            :returns: The pipeline itself
+            :rtype: :class:`Pipeline`
+        """
+        return self.pipe(_drop, columns)
+
+    @instrumented
+    def run(self, dataframe):
+        """
+            Runs the recorded steps on ``dataframe``.
+
+            :param dataframe: The DataFrame object to work on.
+            :type dataframe: :class:`DataFrame <pandas.DataFrame>`
+
+            :returns: The transformed DataFrame
+            :rtype: :class:`DataFrame <pandas.DataFrame>`
+        """
+        operations, names = [], list(dataframe.columns)
+        for func, args, kwargs in self._steps:
+            translate = _TRANSLATORS.get(func)
+            translated = translate(names, *args, **kwargs) if translate else None
+            if translated is not None:
+                operations.extend(translated)
+                continue
+            if operations:
+                dataframe, operations = _run_fused(dataframe, operations, names), []
+            dataframe = func(dataframe, *args, **kwargs)
+            names = list(dataframe.columns)
+        if operations:
+            dataframe = _run_fused(dataframe, operations, names)
+        return dataframe
+
+
+def _drop(dataframe, columns):
+    """
+        Drops the existing ones of ``columns``.
+    """
+    return dataframe.drop(columns=[column for column in columns if column in dataframe.columns])
+
+
+def _add_name(names, column):
+    """
+        Appends ``column`` to ``names``, if it is a new column.
+    """
+    if column not in names:
+        names.append(column)
+
+
+def _extract_dict_key_operations(names, column, key, new_column=None, separator='.', typed=False,
+                                 categorical=False, inplace=False):  # pylint: disable=unused-argument
+    """
+        Translates :func:`extract_dict_key` to an operation.
+    """
+    new_column = _dict_key_column(column, key, new_column, separator)
+    _add_name(names, new_column)
+    return [('key', (column,), (new_column,), (key, typed, categorical))]
+
+
+def _extract_dictionary_operations(names, column, key_list=None, prefix=None, separator='.',
+                                   typed=False, categorical=False):
+    """
+        Translates :func:`extract_dictionary` to operations, if the keys are known in advance.
+    """
+    if key_list is None:
+        return None
+    return [
+        operation for key in key_list for operation in _extract_dict_key_operations(
+            names, column, key, '{}{}{}'.format(prefix, separator, key) if prefix else prefix,
+            separator, typed, categorical
+        )
+    ] + _drop_operations(names, [column])
+
+
+def _convert_to_type_operations(names, mapper, *types, kwargs_map=None, date_cache=None,
+                                n_threads=1, inplace=False):  # pylint: disable=unused-argument
+    """
+        Translates :func:`convert_to_type` to an operation per column.
+    """
+    plan = ConversionPlan(mapper, *types, kwargs_map=kwargs_map, date_cache=date_cache)
+    return [
+        ('column', (column,), (column,), plan.convert_series)
+        for column in plan.columns if column in names
+    ]
+
+
+def _truncate_strings_operations(names, length_mapping, unit='chars',
+                                 n_threads=1, inplace=False):  # pylint: disable=unused-argument
+    """
+        Translates :func:`truncate_strings` to an operation per column. Invalid arguments are
+        left to :func:`truncate_strings` to report.
+    """
+    if unit not in ('chars', 'bytes'):
+        return None
+    return [
+        ('column', (column,), (column,), partial(_truncate_column, length=length, unit=unit))
+        for column, length in length_mapping.items() if column in names
+    ]
+
+
+def _clear_nan_operations(names, inplace=False, n_threads=1):  # pylint: disable=unused-argument
+    """
+        Translates :func:`clear_nan` to an operation per column.
+    """
+    return [('column', (column,), (column,), _clear_series) for column in names]
+
+
+def _clear_series(series):
+    """
+        Returns ``series`` with ``None`` instead of null values.
+    """
+    cleared = _clear_column(series)
+    return series if cleared is None else cleared
+
+
+def _drop_operations(names, columns):
+    """
+        Translates :meth:`Pipeline.drop` to an operation.
+    """
+    for column in columns:
+        if column in names:
+            names.remove(column)
+    return [('drop', (), (), tuple(columns))]
+
+
+_TRANSLATORS = {
+    extract_dict_key: _extract_dict_key_operations,
+    extract_dictionary: _extract_dictionary_operations,
+    convert_to_type: _convert_to_type_operations,
+    truncate_strings: _truncate_strings_operations,
+    clear_nan: _clear_nan_operations,
+    _drop: _drop_operations,
+}
+
+
+def _plan_releases(operations):
+    """
+        Walks ``operations`` backwards and finds the ones whose results are dropped before they
+        are read, and the columns that can be released after each operation.
+    """
+    next_event, skipped, releases = {}, [], []
+    for kind, reads, writes, payload in reversed(operations):
+        if kind == 'drop':
+            next_event.update(dict.fromkeys(payload, 'drop'))
+            skipped.append(False)
+            releases.append(())
+            continue
+        skip = all(next_event.get(column) == 'drop' for column in writes)
+        skipped.append(skip)
+        releases.append(tuple(
+            column for column in reads + writes if next_event.get(column) == 'drop'
+        ))
+        if not skip:
+            next_event.update(dict.fromkeys(writes, 'write'))
+            next_event.update(dict.fromkeys(reads, 'read'))
+    initial = [column for column, event in next_event.items() if event == 'drop']
+    return initial, skipped[::-1], releases[::-1]
+
+
+def _group_extractions(operations, skipped):
+    """
+        Groups the key extractions by the version of their source column, so every group can
+        be collected in a single pass.
+    """
+    versions, groups, keys = {}, [], {}
+    for (kind, reads, writes, payload), skip in zip(operations, skipped):
+        group = None
+        if kind == 'key':
+            key, typed, categorical = payload
+            group = (reads[0], versions.get(reads[0], 0), typed, categorical)
+            if not skip:
+                keys.setdefault(group, []).append(key)
+        groups.append(group)
+        for column in writes:
+            versions[column] = versions.get(column, 0) + 1
+    return groups, keys
+
+
+def _run_fused(dataframe, operations, names):
+    """
+        Runs translated column-wise operations and builds the resulting DataFrame once.
+    """
+    initial, skipped, releases = _plan_releases(operations)
+    groups, keys = _group_extractions(operations, skipped)
+    columns, gone, extracted = {}, set(initial), {}
+
+    def get(column):
+        if column in gone:
+            raise KeyError(column)
+        return columns[column] if column in columns else dataframe[column]
+
+    for operation, skip, release, group in zip(operations, skipped, releases, groups):
+        kind, reads, writes, payload = operation
+        if kind == 'drop':
+            gone.update(payload)
+            for column in payload:
+                columns.pop(column, None)
+        elif not skip:
+            source = get(reads[0])
+            if kind == 'key':
+                if group not in extracted:
+                    extracted[group] = dict(zip(keys[group], _extract_keys(
+                        source, keys[group], typed=group[2], categorical=group[3]
+                    )))
+                result = extracted[group][payload[0]].copy(deep=False)
+            else:
+                result = payload(source)
+            if result is not source:
+                result.name = writes[0]
+                columns[writes[0]] = result
+            gone.difference_update(writes)
+        for column in release:
+            columns.pop(column, None)
+            gone.add(column)
+
+    removed = [column for column in dataframe.columns if column not in names]
+    result = dataframe.drop(columns=removed) if removed else dataframe.copy(deep=False)
+    for column in names:
+        if column in columns:
+            _set_column(result, column, columns[column])
+    if list(result.columns) != names:
+        result = result[names]
+    return result
@@ -2,14 +2,20 @@
     Contains functions to help transform columns data containing complex types,
     like lists or dictionaries.
 """
-from functools import reduce
-from itertools import zip_longest
+import re
+from itertools import chain, zip_longest
 
 import numpy as np
 import pandas as pd
+from pandas._libs.sparse import IntIndex  # pylint: disable=no-name-in-module
 
+from .instrumentation import instrumented
+from .util import _set_column
 
-def extract_dictionary(dataframe, column, key_list=None, prefix=None, separator='.'):
+
+@instrumented
+def extract_dictionary(dataframe, column, key_list=None, prefix=None, separator='.',
+                       typed=False, categorical=False, inplace=False):
     """
         Extract values of keys in ``key_list`` into separate columns.
 
@@ -44,6 +50,11 @@ def extract_dictionary(dataframe, column, key_list=None, prefix=None, separator=
                            as prefix.
         :param str separator: The separator between the prefix and the key name for new column
                               names.
+        :param bool typed: If ``True``, the new columns are built as ``Int64``, ``boolean``,
+                           ``string`` or float arrays. See :func:`extract_dict_key`.
+        :param categorical: Encode the new columns as categorical. See :func:`extract_dict_key`.
+        :type categorical: :class: bool, :class: str or :class: float
+        :param bool inplace: Whether to modify ``dataframe`` itself instead of a shallow copy.
 
         :returns: The extracted DataFrame
         :rtype: :class:`DataFrame <pandas.DataFrame>`
@@ -53,15 +64,21 @@ def extract_dictionary(dataframe, column, key_list=None, prefix=None, separator=
             key_list = next(val for val in dataframe[column] if isinstance(val, dict)).keys()
         except StopIteration:
             key_list = []
-    for key in key_list:
+    key_list = list(key_list)
+    extracted = _extract_keys(dataframe[column], key_list, typed, categorical)
+    if inplace:
+        dataframe.drop(column, axis=1, inplace=True)
+    else:
+        dataframe = dataframe.drop(column, axis=1)
+    for key, series in zip(key_list, extracted):
         new_column = '{}{}{}'.format(prefix, separator, key) if prefix else prefix
-        dataframe = extract_dict_key(
-            dataframe, column, key, new_column=new_column, separator=separator
-        )
-    return dataframe.drop(column, axis=1)
+        _set_column(dataframe, _dict_key_column(column, key, new_column, separator), series)
+    return dataframe
 
 
-def extract_dict_key(dataframe, column, key, new_column=None, separator='.'):
+@instrumented
+def extract_dict_key(dataframe, column, key, new_column=None, separator='.', typed=False,
+                     categorical=False, inplace=False):
     """
         Extract values of ``key`` into ``new_column``. If key is missing, ``None`` is added to
         the column.
@@ -93,18 +110,53 @@ def extract_dict_key(dataframe, column, key, new_column=None, separator='.'):
                                prefix to ``key``.
         :param str separator: The separator between ``column`` and ``key`` if ``new_column`` is
                               not specified.
+        :param bool typed: If ``True``, the type of the collected values is inferred and the new
+                           column is built as ``Int64``, ``boolean``, ``string`` or float
+                           array instead of ``object``. Floats are stored as ``float32`` if no
+                           precision is lost.
+        :param categorical: If ``True``, the collected values are encoded to a categorical column
+                            while building it. ``'auto'`` or a float threshold encodes only if
+                            the number of categories is at most the threshold (``0.05`` for
+                            ``'auto'``) times the number of values.
+        :type categorical: :class: bool, :class: str or :class: float
+        :param bool inplace: Whether to modify ``dataframe`` itself instead of a shallow copy.
 
         :returns: The extracted DataFrame
         :rtype: :class:`DataFrame <pandas.DataFrame>`
     """
-    new_column = new_column or '{}{}{}'.format(column, separator, key) if new_column != "" else key
-    dataframe.loc[:, new_column] = dataframe[column].apply(
-        lambda x: x.get(key) if isinstance(x, dict) else x
-    ).rename(new_column)
+    if not inplace:
+        dataframe = dataframe.copy(deep=False)
+    new_column = _dict_key_column(column, key, new_column, separator)
+    _set_column(dataframe, new_column, _extract_keys(
+        dataframe[column], [key], typed, categorical
+    )[0].rename(new_column))
     return dataframe
 
 
-def expand_list(dataframe, column, new_column=None):
+def _dict_key_column(column, key, new_column=None, separator='.'):
+    """
+        Returns the name of the column the values of ``key`` are extracted into.
+    """
+    return new_column or '{}{}{}'.format(column, separator, key) if new_column != "" else key
+
+
+def _extract_keys(series, keys, typed=False, categorical=False):
+    """
+        Extracts the values of every key in ``keys`` from the dictionaries in ``series``,
+        converting the column to a list only once. Values that are not dictionaries are kept.
+    """
+    values = series.tolist()
+    return [
+        pd.Series(_build_column(
+            [value.get(key) if isinstance(value, dict) else value for value in values],
+            typed, categorical
+        ), index=series.index, dtype=None if values else object)
+        for key in keys
+    ]
+
+
+@instrumented
+def expand_list(dataframe, column, new_column=None, typed=False, categorical=False):
     """
         Expands lists to new rows.
 
@@ -146,6 +198,15 @@ def expand_list(dataframe, column, new_column=None):
         :type column: :class: str
         :param new_column: Name of the new columns. If not defined, columns will not be renamed.
         :type new_column: :class: str
+        :param bool typed: If ``True``, the type of the collected values is inferred and the new
+                           column is built as ``Int64``, ``boolean``, ``string`` or float
+                           array instead of ``object``. Floats are stored as ``float32`` if no
+                           precision is lost.
+        :param categorical: If ``True``, the collected values are encoded to a categorical column
+                            while building it. ``'auto'`` or a float threshold encodes only if
+                            the number of categories is at most the threshold (``0.05`` for
+                            ``'auto'``) times the number of values.
+        :type categorical: :class: bool, :class: str or :class: float
 
         :returns: The expanded DataFrame
         :rtype: :class:`DataFrame <pandas.DataFrame>`
@@ -160,11 +221,14 @@ def expand_list(dataframe, column, new_column=None):
         indices = pd.MultiIndex.from_tuples(indices, names=dataframe.index.names)
     else:
         indices = pd.Series(indices, name=dataframe.index.name)
+    if typed or categorical:
+        values = _build_column(values, typed, categorical)
     return pd.DataFrame({new_column: values}, index=indices).\
         merge(dataframe.drop(column, axis=1), left_index=True, right_index=True, how='outer')
 
 
-def expand_lists(dataframe, columns, new_columns=None):
+@instrumented
+def expand_lists(dataframe, columns, new_columns=None, typed=False):
     """
         Expands multiple lists to new rows. Pairs elements of lists respective to their index.
         Pads with ``None`` to the longest list.
@@ -217,6 +281,10 @@ def expand_lists(dataframe, columns, new_columns=None):
         :type columns: :class: list or :class: tuple of :class: str
         :param new_columns: Name of the new columns. If not defined, columns will not be renamed.
         :type new_columns: :class: list or :class: tuple of :class: str
+        :param bool typed: If ``True``, the type of the collected values is inferred and the new
+                           columns are built as ``Int64``, ``boolean``, ``string`` or float
+                           arrays instead of ``object``. Floats are stored as ``float32`` if no
+                           precision is lost.
 
         :returns: The expanded DataFrame
         :rtype: :class:`DataFrame <pandas.DataFrame>`
@@ -225,7 +293,7 @@ def expand_lists(dataframe, columns, new_columns=None):
     if not len(columns) == len(new_columns):
         raise ValueError('new_columns must contain the same amount of items as columns')
     if len(columns) == 1:
-        return expand_list(dataframe, *columns, *new_columns)
+        return expand_list(dataframe, *columns, *new_columns, typed=typed)
     if not len(columns) > 1:
         raise ValueError('columns argument must contain at least two items.')
     values, indices = [], []
@@ -237,16 +305,473 @@ def expand_lists(dataframe, columns, new_columns=None):
         indices = pd.MultiIndex.from_tuples(indices, names=dataframe.index.names)
     else:
         indices = pd.Series(indices, name=dataframe.index.name)
+    if typed:
+        values = dict(zip(new_columns, map(_infer_typed_array, map(list, zip(*values))))) \
+            if values else {new_column: [] for new_column in new_columns}
     return pd.DataFrame(values, columns=new_columns, index=indices).fillna(np.nan).\
         merge(dataframe.drop(columns, axis=1), left_index=True, right_index=True, how='outer')
 
 
-def merge_columns(dataframe, col_header_list, new_column_name, keep=None, aggr=None):
+_AUTO_CATEGORICAL_THRESHOLD = 0.05
+_CATEGORICAL_CHUNK_SIZE = 65536
+
+_TYPED_DTYPES = {
+    'integer': 'Int64',
+    'boolean': 'boolean',
+    'string': 'string',
+    'floating': np.float64,
+    'mixed-integer-float': np.float64,
+}
+
+
+def _infer_typed_array(values):
+    """
+        Builds a typed array from a list of collected values with a single type inference pass.
+        Floats are narrowed to ``float32`` only if no precision is lost. Values of other types
+        than int, bool, str and float, or out of the range of the inferred type, are returned
+        as they are.
+    """
+    dtype = _TYPED_DTYPES.get(pd.api.types.infer_dtype(values, skipna=True))
+    if dtype is None:
+        return values
+    try:
+        if dtype is not np.float64:
+            return pd.array(values, dtype=dtype)
+        array = np.array(values, dtype=dtype)
+    except OverflowError:
+        return values
+    with np.errstate(over='ignore'):
+        narrowed = array.astype(np.float32)
+    return narrowed if np.array_equal(narrowed, array, equal_nan=True) else array
+
+
+def _encode_categorical(values, categorical):
+    """
+        Encodes a list of collected values to a categorical, if the number of categories is
+        within the threshold given by ``categorical``. Returns ``None`` otherwise. The values are
+        factorized in chunks, so only the codes are stored for the whole column, and the
+        encoding stops as soon as there are too many categories. The codes are stored at the
+        narrowest width for the number of categories, widened as new categories come up.
+    """
+    limit = len(values)
+    if categorical is not True:
+        limit *= _AUTO_CATEGORICAL_THRESHOLD if categorical == 'auto' else categorical
+    categories = {}
+    codes = np.empty(len(values), dtype=np.int8)
+    chunk = np.empty(min(len(values), _CATEGORICAL_CHUNK_SIZE), dtype=object)
+    for start in range(0, len(values), _CATEGORICAL_CHUNK_SIZE):
+        part = values[start:start + _CATEGORICAL_CHUNK_SIZE]
+        chunk[:len(part)] = part
+        try:
+            chunk_codes, uniques = pd.factorize(chunk[:len(part)])
+            mapping = [categories.setdefault(unique, len(categories)) for unique in uniques]
+        except TypeError:
+            if categorical is True:
+                raise
+            return None
+        if len(categories) > limit:
+            return None
+        if len(categories) > np.iinfo(codes.dtype).max:
+            codes = codes.astype(_codes_dtype(len(categories)))
+        # The appended -1 is picked by the -1 codes of null values.
+        codes[start:start + len(part)] = np.array(mapping + [-1], dtype=codes.dtype)[chunk_codes]
+    return pd.Categorical.from_codes(codes, categories=list(categories))
+
+
+def _codes_dtype(size):
+    """
+        Returns the narrowest integer dtype of categorical codes for ``size`` categories.
+    """
+    return next(dtype for dtype in (np.int8, np.int16, np.int32, np.int64)
+                if size <= np.iinfo(dtype).max)
+
+
+def _build_column(values, typed=False, categorical=False):
+    """
+        Builds the array of a new column from a list of collected values.
+    """
+    if categorical:
+        encoded = _encode_categorical(values, categorical)
+        if encoded is not None:
+            return encoded
+    return _infer_typed_array(values) if typed else values
+
+
+def _flatten_list_column(series):
+    """
+        Flattens a column of lists into a single values buffer. Returns the buffer, the length
+        of every row's list and a mask of rows holding a list at all. Anything that is not a
+        :class:`list`, :class:`tuple` or :class:`ndarray <numpy.ndarray>` is treated as missing.
+    """
+    is_list = np.fromiter(
+        (isinstance(value, (list, tuple, np.ndarray)) for value in series),
+        dtype=bool, count=len(series)
+    )
+    lists = series[is_list]
+    lengths = np.zeros(len(series), dtype=np.int64)
+    lengths[is_list] = np.fromiter(
+        (len(value) for value in lists), dtype=np.int64, count=len(lists)
+    )
+    values = pd.Series(
+        list(chain.from_iterable(lists)), dtype=object
+    ).infer_objects().to_numpy()
+    return values, lengths, is_list
+
+
+def _segmented_reduce(ufunc, values, lengths, fill_value):
+    """
+        Reduces every non-empty segment of ``values`` described by ``lengths`` with
+        :meth:`ufunc.reduceat <numpy.ufunc.reduceat>`. Empty segments get ``fill_value``,
+        which is ``NaT`` instead of ``NaN`` for datetimes and timedeltas.
+    """
+    if values.dtype.kind in 'mM' and fill_value is not None and pd.isna(fill_value):
+        fill_value = values.dtype.type('NaT')
+    dtype = object if values.dtype == object else np.result_type(values.dtype, fill_value)
+    result = np.full(len(lengths), fill_value, dtype=dtype)
+    if len(values):
+        starts = np.cumsum(lengths) - lengths
+        result[lengths > 0] = ufunc.reduceat(values, starts[lengths > 0])
+    return result
+
+
+def _skip_nulls(values, lengths):
+    """
+        Removes the null elements from the flattened ``values``. Returns the remaining values and
+        the number of them in every segment described by ``lengths``.
+    """
+    nulls = pd.isna(values)
+    if not nulls.any():
+        return values, lengths
+    counts = _segmented_reduce(np.add, (~nulls).astype(np.int64), lengths, 0)
+    return pd.Series(values[~nulls], dtype=values.dtype).infer_objects().to_numpy(), counts
+
+
+_LIST_REDUCERS = {
+    'sum': np.add,
+    'min': np.minimum,
+    'max': np.maximum,
+}
+
+
+@instrumented
+def reduce_list(dataframe, column, funcs=('len',), contains=None, prefix=None, separator='.',
+                inplace=False):
+    """
+        Reduces the list in every row of ``column`` to scalars without expanding it to new rows.
+        The lists are flattened once and all reductions are computed as segmented operations on
+        the flattened values. Null elements are skipped, so ``sum``, ``min``, ``max`` and ``mean``
+        are equal to calling :func:`expand_list` and aggregating by the original index, while
+        ``len`` is the length of the list, nulls included.
+
+        .. code-block:: python
+
+            >>> df = DataFrame({
+            ...     'trial_num': [1, 2, 3],
+            ...     'samples': [[1, 2, 3, 4], [], None]
+            ... })
+            >>> df.pipe(reduce_list, 'samples', funcs=['len', 'sum', 'max'], contains=3)
+               trial_num       samples  samples.len  samples.sum  samples.max  samples.contains
+            0          1  [1, 2, 3, 4]            4           10          4.0              True
+            1          2            []            0            0          NaN             False
+            2          3          None            0            0          NaN             False
+
+        :param dataframe: The DataFrame object to work on.
+        :type dataframe: :class:`DataFrame <pandas.DataFrame>`
+        :param str column: The name of the column containing the lists.
+        :param funcs: Reductions to compute, any of ``len``, ``sum``, ``min``, ``max`` and
+                      ``mean``.
+        :type funcs: :class: list or :class: tuple of :class: str
+        :param contains: If given, a boolean column is added whether the list contains this value.
+        :param str prefix: Prefix for new column names. By default, ``column`` will be applied
+                           as prefix.
+        :param str separator: The separator between the prefix and the reduction name for new
+                              column names.
+        :param bool inplace: Whether to modify ``dataframe`` itself instead of a shallow copy.
+
+        :returns: The DataFrame with the reduced columns
+        :rtype: :class:`DataFrame <pandas.DataFrame>`
+
+        :raises: :exc:`ValueError`
+    """
+    if not inplace:
+        dataframe = dataframe.copy(deep=False)
+    unknown = [func for func in funcs if func not in _LIST_REDUCERS and func not in ('len', 'mean')]
+    if unknown:
+        raise ValueError(f'Unknown reductions: {", ".join(map(str, unknown))}')
+    prefix = prefix or column
+    values, lengths, _ = _flatten_list_column(dataframe[column])
+    valid, counts = _skip_nulls(values, lengths)
+    if valid.dtype == bool:
+        valid = valid.astype(np.int64)
+    results = {}
+    for func in funcs:
+        if func == 'len':
+            result = lengths
+        elif func == 'sum':
+            result = _segmented_reduce(np.add, valid, counts, 0)
+        elif func == 'mean':
+            result = _segmented_reduce(np.add, valid, counts, np.nan) / np.maximum(counts, 1)
+        else:
+            result = _segmented_reduce(_LIST_REDUCERS[func], valid, counts, np.nan)
+        results[f'{prefix}{separator}{func}'] = result
+    if contains is not None:
+        matches = pd.Series(values, dtype=values.dtype).eq(contains).to_numpy()
+        results[f'{prefix}{separator}contains'] = _segmented_reduce(
+            np.logical_or, matches, lengths, False
+        )
+    for new_column, result in results.items():
+        _set_column(dataframe, new_column, pd.Series(result, index=dataframe.index).infer_objects())
+    return dataframe
+
+
+def _rebuild_lists(series, values, lengths, is_list):
+    """
+        Splits the flattened ``values`` back into lists by ``lengths``. Rows that did not hold a
+        list keep their original value.
+    """
+    if values.dtype.kind in 'mM':
+        # tolist() of datetime64 and timedelta64 arrays returns integer nanoseconds
+        values = pd.Series(values).astype(object).to_numpy()
+    chunks = np.split(values, np.cumsum(lengths)[:-1]) if len(series) else []
+    return pd.Series(
+        [chunk.tolist() if flag else original
+         for chunk, flag, original in zip(chunks, is_list, series)],
+        index=series.index, dtype=object, name=series.name
+    )
+
+
+def _join_expanded(dataframe, column, new_column, values, lengths):
+    """
+        Builds the same result as :func:`expand_list` directly from the flattened ``values``.
+    """
+    return pd.DataFrame({new_column: values}, index=dataframe.index.repeat(lengths)).\
+        merge(dataframe.drop(column, axis=1), left_index=True, right_index=True, how='outer')
+
+
+@instrumented
+def filter_list(dataframe, column, condition, new_column=None, expand=False, inplace=False):
+    """
+        Keeps only the list elements in ``column`` that satisfy ``condition``. The condition is
+        evaluated once on all elements flattened into a single :class:`Series <pandas.Series>`,
+        then the shorter lists are rebuilt. With ``expand`` the filtered elements are expanded
+        to new rows right away, like :func:`expand_list` would do, without rebuilding the lists.
+
+        .. code-block:: python
+
+            >>> df = DataFrame({
+            ...     'trial_num': [1, 2, 3],
+            ...     'samples': [[1, 2, 3, 4], [5], None]
+            ... })
+            >>> df.pipe(filter_list, 'samples', lambda values: values > 2)
+               trial_num  samples
+            0          1   [3, 4]
+            1          2      [5]
+            2          3     None
+            >>> df.pipe(filter_list, 'samples', {1, 5})
+               trial_num  samples
+            0          1      [1]
+            1          2      [5]
+            2          3     None
+
+        :param dataframe: The DataFrame object to work on.
+        :type dataframe: :class:`DataFrame <pandas.DataFrame>`
+        :param str column: The name of the column containing the lists.
+        :param condition: Either a callable getting the flattened elements as a
+                          :class:`Series <pandas.Series>` and returning a boolean mask, or a
+                          collection of values to keep.
+        :param str new_column: Name of the new column. By default, ``column`` is overwritten.
+        :param bool expand: Whether to expand the kept elements to new rows.
+        :param bool inplace: Whether to modify ``dataframe`` itself instead of a shallow copy.
+
+        :returns: The filtered DataFrame
+        :rtype: :class:`DataFrame <pandas.DataFrame>`
+    """
+    if not inplace:
+        dataframe = dataframe.copy(deep=False)
+    new_column = new_column or column
+    values, lengths, is_list = _flatten_list_column(dataframe[column])
+    flat = pd.Series(values, dtype=values.dtype)
+    mask = condition(flat) if callable(condition) else flat.isin(condition)
+    mask = np.asarray(mask, dtype=bool)
+    values = values[mask]
+    lengths = _segmented_reduce(np.add, mask.astype(np.int64), lengths, 0)
+    if expand:
+        return _join_expanded(dataframe, column, new_column, values, lengths)
+    _set_column(
+        dataframe, new_column, _rebuild_lists(dataframe[column], values, lengths, is_list)
+    )
+    return dataframe
+
+
+@instrumented
+def map_list(dataframe, column, mapper, new_column=None, expand=False, inplace=False):
+    """
+        Maps every list element in ``column`` through ``mapper``. The mapping is done once with
+        :meth:`Series.map() <pandas.Series.map>` on all elements flattened into a single
+        :class:`Series <pandas.Series>`, so elements missing from a :class:`dict` mapper become
+        ``NaN``. With ``expand`` the mapped elements are expanded to new rows right away, like
+        :func:`expand_list` would do, without rebuilding the lists.
+
+        .. code-block:: python
+
+            >>> df = DataFrame({
+            ...     'trial_num': [1, 2, 3],
+            ...     'samples': [[1, 2], [2], None]
+            ... })
+            >>> df.pipe(map_list, 'samples', {1: 'a', 2: 'b'})
+               trial_num  samples
+            0          1   [a, b]
+            1          2      [b]
+            2          3     None
+
+        :param dataframe: The DataFrame object to work on.
+        :type dataframe: :class:`DataFrame <pandas.DataFrame>`
+        :param str column: The name of the column containing the lists.
+        :param mapper: A :class:`dict`, :class:`Series <pandas.Series>` or callable, as accepted
+                       by :meth:`Series.map() <pandas.Series.map>`.
+        :param str new_column: Name of the new column. By default, ``column`` is overwritten.
+        :param bool expand: Whether to expand the mapped elements to new rows.
+        :param bool inplace: Whether to modify ``dataframe`` itself instead of a shallow copy.
+
+        :returns: The mapped DataFrame
+        :rtype: :class:`DataFrame <pandas.DataFrame>`
+    """
+    if not inplace:
+        dataframe = dataframe.copy(deep=False)
+    new_column = new_column or column
+    values, lengths, is_list = _flatten_list_column(dataframe[column])
+    values = pd.Series(values, dtype=values.dtype).map(mapper).to_numpy()
+    if expand:
+        return _join_expanded(dataframe, column, new_column, values, lengths)
+    _set_column(
+        dataframe, new_column, _rebuild_lists(dataframe[column], values, lengths, is_list)
+    )
+    return dataframe
+
+
+@instrumented
+def list_to_indicators(dataframe, column, sparse=True, prefix=None, separator='.',
+                       dtype=np.uint8, as_csr=False):
+    """
+        Encodes the lists in ``column`` as multi-hot indicator columns, one for every distinct
+        element, similarly to :func:`get_dummies() <pandas.get_dummies>`. The elements are
+        factorized once on the flattened lists, so the encoding never expands the rows and, in
+        sparse mode, uses memory proportional to the total number of elements only.
+
+        .. code-block:: python
+
+            >>> df = DataFrame({
+            ...     'trial_num': [1, 2, 3],
+            ...     'tags': [['a', 'b'], ['b'], None]
+            ... })
+            >>> df.pipe(list_to_indicators, 'tags')
+               trial_num  tags.a  tags.b
+            0          1       1       1
+            1          2       0       1
+            2          3       0       0
+            >>> (data, indices, indptr), vocabulary = list_to_indicators(df, 'tags', as_csr=True)
+            >>> indices, indptr, vocabulary
+            (array([0, 1, 1]), array([0, 2, 3, 3]), array(['a', 'b'], dtype=object))
+
+        .. warning::
+            ``column`` will be dropped from the DataFrame.
+
+        :param dataframe: The DataFrame object to work on.
+        :type dataframe: :class:`DataFrame <pandas.DataFrame>`
+        :param str column: The name of the column containing the lists.
+        :param bool sparse: Whether the indicator columns should be
+                            :class:`SparseDtype <pandas.SparseDtype>` columns.
+        :param str prefix: Prefix for new column names. By default, ``column`` will be applied
+                           as prefix.
+        :param str separator: The separator between the prefix and the element for new column
+                              names.
+        :param dtype: The dtype of the indicator values.
+        :param bool as_csr: Return the scipy compatible ``(data, indices, indptr)`` triple of a
+                            compressed sparse row matrix and the vocabulary of the columns
+                            instead of a DataFrame.
+
+        :returns: The DataFrame with the indicator columns
+        :rtype: :class:`DataFrame <pandas.DataFrame>`
+    """
+    prefix = prefix or column
+    n_rows = len(dataframe.index)
+    values, lengths, _ = _flatten_list_column(dataframe[column])
+    codes, vocabulary = pd.factorize(values)
+    width = max(len(vocabulary), 1)
+    rows = np.repeat(np.arange(n_rows, dtype=np.int64), lengths)
+    keys = np.unique(rows[codes >= 0] * width + codes[codes >= 0])
+    rows, indices = np.divmod(keys, width)
+    if as_csr:
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(np.bincount(rows, minlength=n_rows))
+        return (np.ones(len(indices), dtype=dtype), indices, indptr), np.asarray(vocabulary)
+
+    rows = rows[np.argsort(indices, kind='stable')].astype(np.int32)
+    bounds = np.cumsum(np.bincount(indices, minlength=len(vocabulary)))[:-1]
+    columns = {}
+    for value, column_rows in zip(vocabulary, np.split(rows, bounds)):
+        if sparse:
+            indicator = pd.arrays.SparseArray(
+                np.ones(len(column_rows), dtype=dtype),
+                sparse_index=IntIndex(n_rows, column_rows),
+                fill_value=0, dtype=pd.SparseDtype(dtype, 0)
+            )
+        else:
+            indicator = np.zeros(n_rows, dtype=dtype)
+            indicator[column_rows] = 1
+        columns[f'{prefix}{separator}{value}'] = indicator
+    return pd.concat(
+        [dataframe.drop(column, axis=1), pd.DataFrame(columns, index=dataframe.index)], axis=1
+    )
+
+
+_MERGE_AGGREGATIONS = ('sum', 'count', 'min', 'max', 'mean', 'any')
+
+
+def _first_valid(block, keep):
+    """
+        Selects the first (or last, if ``keep`` is *last*) notnull value of every row in
+        ``block``. If there is none, the last value in the order of selection is returned.
+    """
+    values = block.to_numpy()
+    notnull = block.notna().to_numpy()
+    if keep == 'last':
+        values, notnull = values[:, ::-1], notnull[:, ::-1]
+    positions = np.where(notnull.any(axis=1), notnull.argmax(axis=1), values.shape[1] - 1)
+    return pd.Series(
+        values[np.arange(len(values)), positions], index=block.index
+    ).infer_objects()
+
+
+def _aggregate_block(block, aggr, chunk_size=None):
+    """
+        Calls ``aggr`` with the values of ``block`` as a 2-D array, in chunks of ``chunk_size``
+        rows if given, and concatenates the returned 1-D arrays.
+    """
+    values = block.to_numpy()
+    chunk_size = chunk_size or len(values) or 1
+    result = np.concatenate([
+        np.asarray(aggr(values[start:start + chunk_size])).reshape(-1)
+        for start in range(0, max(len(values), 1), chunk_size)
+    ])
+    if len(result) != len(values):
+        raise ValueError(
+            f'aggr returned {len(result)} values for a block of {len(values)} rows.'
+        )
+    return pd.Series(result, index=block.index)
+
+
+@instrumented
+def merge_columns(dataframe, col_header_list, new_column_name, keep=None, aggr=None,
+                  raw=False, chunk_size=None, inplace=False):
     """
         Add a new column or modify an existing one in *dataframe* called *new_column_name* by
-        iterating over the rows and select the proper notnull element from the values of
-        *col_header_list* columns in the given row if *keep* is filled OR call the *aggr*
-        function with the values of *col_header_list*. Only one of (*keep*, *aggr*) can be filled.
+        selecting the proper notnull element from the values of *col_header_list* columns in
+        every row if *keep* is filled OR aggregate the values of *col_header_list* with *aggr*.
+        Only one of (*keep*, *aggr*) can be filled.
+
+        The selection of *keep* and the named aggregations are vectorized over the whole block
+        of columns, only a callable *aggr* is called row by row.
 
         :param dataframe: the pandas.DataFrame object to modify
         :param col_header_list: list of the names of the headers to merge
@@ -255,15 +780,25 @@ def merge_columns(dataframe, col_header_list, new_column_name, keep=None, aggr=N
         :param str keep: Specify whether the first or the last proper value is needed.
                          values: *first* and *last* as string.
         :param aggr: Callable function which will get the values of *col_header_list* as parameter.
-                     The return value of this function will be the value in *new_column_name*
+                     The return value of this function will be the value in *new_column_name*.
+                     Alternatively the name of a row-wise reduction: *sum*, *count*, *min*,
+                     *max*, *mean* or *any*, which skip null values like their
+                     :class:`DataFrame <pandas.DataFrame>` method counterparts.
+        :param raw: How a callable *aggr* gets the values. By default, a
+                    :class:`Series <pandas.Series>` for every row, with ``True`` a
+                    :class:`ndarray <numpy.ndarray>` for every row. With *block*, *aggr* is
+                    called with the 2-D :class:`ndarray <numpy.ndarray>` of all rows and must
+                    return a 1-D array with one value per row.
+        :param int chunk_size: In *block* mode, the number of rows passed to *aggr* at once.
+                               By default, all rows are passed in a single call.
+        :param bool inplace: Whether to modify ``dataframe`` itself instead of a shallow copy.
 
         :returns: The merged DataFrame
         :rtype: :class:`DataFrame <pandas.DataFrame>`
     """
-    if keep and aggr:
-        raise ValueError(
-            'Parameter keep and aggr can not be handled at the same time. Use only one.'
-        )
+    if not inplace:
+        dataframe = dataframe.copy(deep=False)
+    _check_merge_arguments(keep, aggr)
 
     old_columns = [x for x in col_header_list if x in list(dataframe)]
 
@@ -272,27 +807,144 @@ def merge_columns(dataframe, col_header_list, new_column_name, keep=None, aggr=N
             f'None of the following columns were found: {", ".join(col_header_list)}'
         )
 
+    _set_column(dataframe, new_column_name, _merge_block(
+        dataframe[old_columns], keep, aggr, raw=raw, chunk_size=chunk_size
+    ))
+    return dataframe
+
+
+def _check_merge_arguments(keep, aggr):
+    """
+        Validates the ``keep`` and ``aggr`` arguments of :func:`merge_columns` and
+        :func:`merge_column_groups`.
+    """
+    if keep and aggr:
+        raise ValueError(
+            'Parameter keep and aggr can not be handled at the same time. Use only one.'
+        )
+    if keep and keep not in ('first', 'last'):
+        raise ValueError('Improper value for parameter keep. Possible values: first, last.')
+    if not keep and aggr not in _MERGE_AGGREGATIONS and not callable(aggr):
+        raise ValueError(
+            'Improper value for parameter aggr. It should be a function or one of: '
+            f'{", ".join(_MERGE_AGGREGATIONS)}.'
+        )
+
+
+def _merge_block(block, keep, aggr, raw=False, chunk_size=None):
+    """
+        Merges the columns of ``block`` into a single :class:`Series <pandas.Series>`, as
+        described at :func:`merge_columns`.
+    """
     if keep:
-        if keep not in ('first', 'last'):
-            raise ValueError('Improper value for parameter keep. Possible values: first, last.')
+        return _first_valid(block, keep)
+    if aggr in _MERGE_AGGREGATIONS:
+        return getattr(block, aggr)(axis=1)
+    if raw == 'block':
+        return _aggregate_block(block, aggr, chunk_size)
+    return block.apply(aggr, axis=1, raw=raw)
+
+
+@instrumented
+def merge_column_groups(dataframe, groups, keep=None, aggr=None, raw=False, chunk_size=None,
+                        drop=False):
+    r"""
+        Merges many groups of columns at once, as :func:`merge_columns` does for a single group.
+        The columns are looked up only once and all merged columns are attached to the frame
+        in a single step, instead of growing the frame column by column.
 
-        first_valid = lambda x, y: y if pd.isnull(x) else x
-        if keep.startswith('f'):
-            aggr = lambda x: reduce(first_valid, x.tolist())
-        else:
-            aggr = lambda x: reduce(first_valid, x.tolist()[::-1])
+        .. code-block:: python
 
-    if not callable(aggr):
-        raise ValueError('Improper value for parameter aggr. It should be a function.')
+            >>> df = pd.DataFrame({
+            ...     'addr_v1': [None, 'Main St.', None],
+            ...     'addr_v2': ['Elm St.', None, None],
+            ...     'zip_v1': [1000, None, None],
+            ...     'zip_v2': [None, 2000, 3000],
+            ... })
+            >>> df.pipe(merge_column_groups, r'(.*)_v\d+', keep='first', drop=True)
+                   addr     zip
+            0   Elm St.  1000.0
+            1  Main St.  2000.0
+            2      None  3000.0
 
-    dataframe[new_column_name] = dataframe[old_columns].apply(aggr, axis=1)
-    return dataframe
+        :param dataframe: The DataFrame object to work on.
+        :type dataframe: :class:`DataFrame <pandas.DataFrame>`
+        :param groups: Either a :class:`dict` with the new column names as keys and the lists
+                       of columns to merge as values, or a regular expression. In the latter
+                       case, every column matching the expression is merged into the column
+                       named by the first group of the match.
+        :type groups: :class:`dict` or :class:`str`
+        :param str keep: Same as at :func:`merge_columns`.
+        :param aggr: Same as at :func:`merge_columns`.
+        :param raw: Same as at :func:`merge_columns`.
+        :param int chunk_size: Same as at :func:`merge_columns`.
+        :param bool drop: Whether the merged columns should be dropped.
+
+        :returns: The merged DataFrame
+        :rtype: :class:`DataFrame <pandas.DataFrame>`
 
+        :raises: :exc:`ValueError`
+    """
+    _check_merge_arguments(keep, aggr)
+    if isinstance(groups, dict):
+        existing = set(dataframe.columns)
+        groups = {
+            new_column: [column for column in columns if column in existing]
+            for new_column, columns in groups.items()
+        }
+    else:
+        pattern, groups = re.compile(groups), {}
+        if not pattern.groups:
+            raise ValueError('The regular expression must contain a group for the column names.')
+        for column in dataframe.columns:
+            match = pattern.fullmatch(column) if isinstance(column, str) else None
+            if match:
+                groups.setdefault(match.group(1), []).append(column)
+    missing = [str(new_column) for new_column, columns in groups.items() if not columns]
+    if missing:
+        raise ValueError(f'No columns were found for the following groups: {", ".join(missing)}')
+
+    merged = pd.DataFrame({
+        new_column: _merge_block(dataframe[columns], keep, aggr, raw=raw, chunk_size=chunk_size)
+        for new_column, columns in groups.items()
+    }, index=dataframe.index)
+    obsolete = set(merged.columns)
+    if drop:
+        obsolete.update(column for columns in groups.values() for column in columns)
+    result = pd.concat(
+        [dataframe.drop([column for column in dataframe.columns if column in obsolete], axis=1),
+         merged],
+        axis=1
+    )
+    if any(column in dataframe.columns for column in merged.columns):
+        # Overwritten columns keep their position, like with merge_columns.
+        result = result[
+            [column for column in dataframe.columns if column in result.columns] +
+            [column for column in merged.columns if column not in dataframe.columns]
+        ]
+    return result
 
-def concatenate_columns(dataframe, columns, new_column, descriptor=None, mapper=None):
+
+def _interleave_columns(dataframe):
+    """
+        Returns the values of the columns of ``dataframe`` interleaved row by row. Extension
+        arrays, e.g. nullable integers or categoricals, keep their dtype.
+    """
+    if all(isinstance(dtype, np.dtype) for dtype in dataframe.dtypes):
+        return dataframe.to_numpy().reshape(-1)
+    rows, columns = dataframe.shape
+    values = pd.concat([series for _, series in dataframe.items()], ignore_index=True).array
+    return values.take(np.arange(rows * columns).reshape(columns, rows).T.ravel())
+
+
+@instrumented
+def concatenate_columns(dataframe, columns, new_column, descriptor=None, mapper=None,
+                        categorical=True):
     """
         Concatenates `columns` together along the indeces and adds a `descriptor` column,
-        if specified, with the column name where the data originates from.
+        if specified, with the column name where the data originates from. The values of every
+        row are interleaved in the order of `columns`, keeping the original order of the rows.
+        The `descriptor` column is categorical, unless ``categorical`` is ``False``.
 
         .. code-block:: python
 
@@ -320,21 +972,26 @@ def concatenate_columns(dataframe, columns, new_column, descriptor=None, mapper=
         :type descriptor: :class: str
         :param mapper: A map to apply to `descriptor` values
         :type mapper: :class: dict
+        :param categorical: Whether the `descriptor` column is categorical. ``'auto'`` or a
+                            float threshold encodes only if the number of distinct labels is at
+                            most the threshold (``0.05`` for ``'auto'``) times the number of
+                            rows.
+        :type categorical: :class: bool, :class: str or :class: float
 
         :returns: The concatenated DataFrame
         :rtype: :class:`DataFrame <pandas.DataFrame>`
     """
     if mapper is None:
         mapper = {}
-    descriptor = descriptor or '_desc'
-    parts = (
-        pd.DataFrame(
-            data={
-                new_column: dataframe[col],
-                descriptor: [mapper.get(col, col) for _ in range(len(dataframe.index))]
-            },
-            index=dataframe.index
-        ) for col in columns if col in dataframe
-    )
-
-    return pd.concat(list(parts)).drop('_desc', axis=1, errors='ignore').sort_index()
+    columns = [col for col in columns if col in dataframe]
+    data = {new_column: _interleave_columns(dataframe[columns])}
+    if descriptor:
+        labels = np.array([mapper.get(col, col) for col in columns], dtype=object)
+        codes, labels = pd.factorize(labels)
+        codes = np.tile(codes, len(dataframe.index))
+        if categorical is True or categorical and len(labels) <= len(codes) * (
+                _AUTO_CATEGORICAL_THRESHOLD if categorical == 'auto' else categorical):
+            data[descriptor] = pd.Categorical.from_codes(codes, categories=labels)
+        else:
+            data[descriptor] = labels.take(codes)
+    return pd.DataFrame(data, index=dataframe.index.repeat(len(columns)))
@@ -1,8 +1,16 @@
 """
     Contains utility functions.
 """
+import pandas as pd
 
+from .instrumentation import instrumented
 
+# Before pandas 1.5, setting an existing column writes into the array shared with the shallow
+# copies of the DataFrame, if the new values fit its dtype.
+_SETITEM_REPLACES = tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (1, 5)
+
+
+@instrumented
 def check_duplicated_labels(dataframe):
     r"""
         Checks if there are duplications on column labels. Raises `ValueError` if there is any
@@ -21,3 +29,17 @@ def check_duplicated_labels(dataframe):
             ', '.join(dataframe.columns[~dataframe.columns.duplicated()].tolist())
         ))
     return dataframe
+
+
+def _set_column(dataframe, column, values):
+    """
+        Sets ``column`` of ``dataframe`` to ``values``, without writing into the arrays that
+        ``dataframe`` shares with its shallow copies. On older pandas, an existing column is
+        deleted and inserted back at its position.
+    """
+    if _SETITEM_REPLACES or column not in dataframe.columns:
+        dataframe[column] = values
+        return
+    position = dataframe.columns.get_loc(column)
+    del dataframe[column]
+    dataframe.insert(position, column, values)
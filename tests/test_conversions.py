@@ -1,12 +1,16 @@
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
+from decimal import Decimal
 
 import numpy as np
 import pandas as pd
 import pandas.api.types as ptypes
 from pandas.testing import assert_frame_equal
 
-from pandas_extras import NativeDict, clear_nan, convert_to_type, truncate_strings
+from pandas_extras import (
+    ConversionPlan, DatetimeCache, NativeDict, from_native_records, iter_native_rows, clear_nan, convert_to_type, optimize_memory,
+    to_native_records, truncate_strings,
+)
 
 class ConversionsTestCase(unittest.TestCase):
 
@@ -19,6 +23,58 @@ class ConversionsTestCase(unittest.TestCase):
         self.assertEqual(NativeDict.convert_if_needed(np.float32(1.0)), 1.0)
         self.assertEqual(NativeDict.convert_if_needed(np.float64(1.0)), 1.0)
 
+    def test_convert_if_needed_pos_02(self):
+        self.assertEqual(NativeDict.convert_if_needed(pd.Timedelta(seconds=1)), timedelta(seconds=1))
+        self.assertEqual(NativeDict.convert_if_needed(np.timedelta64(1, 's')), timedelta(seconds=1))
+        self.assertIs(type(NativeDict.convert_if_needed(np.bool_(True))), bool)
+        self.assertEqual(NativeDict.convert_if_needed(Decimal('1.5')), Decimal('1.5'))
+        self.assertIsNone(NativeDict.convert_if_needed(Decimal('NaN')))
+        self.assertIsNone(NativeDict.convert_if_needed(pd.NA))
+        self.assertIsNone(NativeDict.convert_if_needed(pd.NaT))
+        self.assertEqual(NativeDict.convert_if_needed([1, 2]), [1, 2])
+
+    def test_register_converter_pos_01(self):
+        class Money(Decimal):
+            pass
+
+        dtype = pd.CategoricalDtype(['x', 'y'])
+        NativeDict.register_converter(Money, float)
+        NativeDict.register_converter(dtype, str.upper)
+        self.addCleanup(NativeDict.unregister_converter, Money)
+        self.addCleanup(NativeDict.unregister_converter, dtype)
+        df = pd.DataFrame({
+            'money': [Money('1.5'), None],
+            'category': pd.Series(['x', None], dtype=dtype),
+            'nullable': pd.array([1, None], dtype='Int64'),
+            'boolean': pd.array([True, None], dtype='boolean'),
+            'timedelta': pd.to_timedelta([1, None], unit='s'),
+        })
+        expected = [
+            {'money': 1.5, 'category': 'X', 'nullable': 1, 'boolean': True, 'timedelta': timedelta(seconds=1)},
+            {'money': None, 'category': None, 'nullable': None, 'boolean': None, 'timedelta': None},
+        ]
+        self.assertListEqual(to_native_records(df), expected)
+        self.assertIs(type(to_native_records(df)[0]['nullable']), int)
+        self.assertEqual(NativeDict.convert_if_needed(Money('2')), 2.0)
+
+    def test_register_converter_pos_02(self):
+        df = pd.DataFrame({'category': pd.Categorical(['a', None, 'b']), 'decimal': [Decimal('1.5')] * 3})
+        NativeDict.register_converter('category', str.upper)
+        NativeDict.register_converter(Decimal, float)
+        try:
+            self.assertDictEqual(to_native_records(df)[0], {'category': 'A', 'decimal': 1.5})
+            self.assertIsNone(to_native_records(df)[1]['category'])
+        finally:
+            NativeDict.unregister_converter('category')
+            NativeDict.unregister_converter(Decimal)
+        self.assertDictEqual(to_native_records(df)[0], {'category': 'a', 'decimal': Decimal('1.5')})
+
+    def test_register_converter_neg_01(self):
+        with self.assertRaises(ValueError):
+            NativeDict.unregister_converter(Decimal)
+        with self.assertRaises(ValueError):
+            NativeDict.unregister_converter('category')
+
     def test_to_dict_with_cls_pos_01(self):
         orig_dict_list = [
             {'int': 1, 'float': 2.0, 'nan': 1, 'nat': datetime.today(), 'other': 'value'},
@@ -27,6 +83,102 @@ class ConversionsTestCase(unittest.TestCase):
         ]
         self.assertListEqual(pd.DataFrame(orig_dict_list).to_dict(orient='records', into=NativeDict), orig_dict_list)
 
+    def test_to_native_records_pos_01(self):
+        df = pd.DataFrame({
+            'int': [1, 2, 3],
+            'uint': np.array([1, 2, 3], dtype=np.uint8),
+            'float': [1.0, np.nan, 2.5],
+            'float32': np.array([0.1, 2, 3], dtype=np.float32),
+            'bool': [True, False, True],
+            'string': ['a', None, 'c'],
+            'date': [pd.Timestamp('2020-01-01'), pd.NaT, pd.Timestamp('2021-01-01')],
+            'utc': pd.to_datetime(['2020-01-01', None, '2021-01-01'], utc=True),
+            'category': pd.Categorical(['a', None, 'a']),
+            'nullable': pd.array([1, None, 3], dtype='Int64'),
+            'object': [np.int64(3), np.float32(1.5), pd.Timestamp('2020-01-01')],
+        })
+        expected = df.to_dict(orient='records', into=NativeDict)
+        result = to_native_records(df)
+        self.assertListEqual(result, expected)
+        for result_row, expected_row in zip(result, expected):
+            self.assertListEqual(
+                [type(value) for value in result_row.values()],
+                [type(value) for value in expected_row.values()]
+            )
+        self.assertIsInstance(to_native_records(df, into=NativeDict)[0], NativeDict)
+        self.assertListEqual(to_native_records(pd.DataFrame(index=[0, 1])), [{}, {}])
+
+    def test_iter_native_rows_pos_01(self):
+        df = pd.DataFrame({
+            'int': [1, 2, 3, 4, 5],
+            'float': [1.0, np.nan, 2.5, 3.0, np.nan],
+            'date': [pd.Timestamp('2020-01-01'), pd.NaT, pd.Timestamp('2021-01-01'), pd.NaT, pd.NaT],
+        })
+        records = df.to_dict(orient='records', into=NativeDict)
+        chunks = list(iter_native_rows(df, chunk_size=2))
+        self.assertListEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertListEqual(
+            [row for chunk in chunks for row in chunk],
+            [tuple(record.values()) for record in records]
+        )
+        self.assertListEqual(
+            [row for chunk in iter_native_rows(df, chunk_size=3, as_tuples=False) for row in chunk],
+            records
+        )
+        with self.assertRaises(ValueError):
+            next(iter_native_rows(df, chunk_size=0))
+
+    def test_from_native_records_pos_01(self):
+        records = [
+            {'id': 1, 'score': 0.5, 'flag': True, 'name': 'a',
+             'created': datetime(2020, 1, 1)},
+            {'id': None, 'score': None, 'flag': None, 'name': None, 'created': None},
+            {'id': 3, 'flag': False},
+        ]
+        df = from_native_records(iter(records), {
+            'id': 'int32', 'score': 'float32', 'flag': 'bool', 'name': 'string',
+            'created': 'datetime64[ns]',
+        })
+        assert_frame_equal(df, pd.DataFrame({
+            'id': pd.array([1, None, 3], dtype='Int32'),
+            'score': np.array([0.5, np.nan, np.nan], dtype='float32'),
+            'flag': pd.array([True, None, False], dtype='boolean'),
+            'name': pd.array(['a', None, None], dtype='string'),
+            'created': [pd.Timestamp('2020-01-01'), pd.NaT, pd.NaT],
+        }))
+
+    def test_from_native_records_pos_02(self):
+        df = pd.DataFrame({
+            'int': [1, 2, 3],
+            'float': [1.0, np.nan, 2.5],
+            'str': ['a', None, 'c'],
+        })
+        assert_frame_equal(
+            from_native_records(to_native_records(df), dict(df.dtypes)), df
+        )
+        empty = from_native_records([], {'int': 'int64', 'str': 'object'})
+        self.assertListEqual(list(empty.columns), ['int', 'str'])
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty['int'].dtype, np.int64)
+
+    def test_from_native_records_pos_03(self):
+        tz = 'Europe/Helsinki'
+        naive, aware = datetime(2020, 1, 1, 12), pd.Timestamp('2020-01-01 12:00', tz='UTC')
+        df = from_native_records(
+            [{'a': naive, 'b': aware, 'c': naive}, {'a': None, 'b': None, 'c': aware}],
+            {'a': f'datetime64[ns, {tz}]', 'b': f'datetime64[ns, {tz}]', 'c': f'datetime64[ns, {tz}]'}
+        )
+        self.assertEqual(df['a'].iloc[0], pd.Timestamp('2020-01-01 12:00', tz=tz))
+        self.assertEqual(df['b'].iloc[0], pd.Timestamp('2020-01-01 14:00', tz=tz))
+        self.assertListEqual(list(df['c']), [pd.Timestamp('2020-01-01 12:00', tz=tz), aware])
+        self.assertTrue(pd.isnull(df['a'].iloc[1]))
+
+    def test_from_native_records_neg_01(self):
+        with self.assertRaisesRegex(ValueError, 'not integers'):
+            from_native_records([{'id': 1}, {'id': 1.7}, {'id': None}], {'id': 'int64'})
+        df = from_native_records([{'id': 1.0}, {'id': None}], {'id': 'int64'})
+        self.assertListEqual(df['id'].tolist()[:1], [1])
+
     def test_convert_to_type_pos_01(self):
         df = pd.DataFrame({
             'date': ['05/06/2018', '05/04/2018'],
@@ -73,6 +225,143 @@ class ConversionsTestCase(unittest.TestCase):
         self.assertTrue(ptypes.is_datetime64_ns_dtype(res['datetime'].dtype))
         self.assertListEqual(res['datetime'].dt.year.tolist(), [2018, 2018])
 
+    def test_convert_to_type_pos_03(self):
+        df = pd.DataFrame({
+            'int': ['4', '8103', '-7'],
+            'unsigned': [1, 2, 300],
+            'number': [1.5, 2.0, None],
+            'date': ['05/06/2018', '2018-04-05T21:56:14', 'not a date'],
+            'utc': pd.to_datetime(['2018-06-05', '2018-04-05', None], utc=True),
+        })
+        mapper = {'integer': 'int', 'unsigned': 'unsigned', 'number': 'number', 'date': ['date', 'utc']}
+        number, utc = df['number'], df['utc']
+        res = convert_to_type(df, mapper)
+        self.assertEqual(res['int'].dtype, np.int16)
+        self.assertEqual(res['unsigned'].dtype, np.uint16)
+        self.assertTrue(np.shares_memory(res['number'].values, number.values))
+        self.assertTrue(np.shares_memory(res['utc'].values, utc.values))
+        self.assertListEqual(res['date'].dt.day.tolist()[:2], [6, 5])
+        self.assertTrue(pd.isnull(res['date'].iloc[2]))
+
+    def test_convert_to_type_pos_04(self):
+        df = pd.DataFrame({'number': [1.0, 2.0], 'other': [1, 300]})
+        res = convert_to_type(
+            df, {'number': ['number', 'other']},
+            kwargs_map={'number': {'downcast': 'float'}, 'other': {'downcast': 'integer'}}
+        )
+        self.assertEqual(res['number'].dtype, np.float32)
+        self.assertEqual(res['other'].dtype, np.int16)
+
+    def test_convert_to_type_date_cache_pos_01(self):
+        df = pd.DataFrame({
+            'date': ['05/06/2018', '2018-04-05T21:56:14', None, 'not a date', '05/06/2018'],
+            'formatted': ['2018.06.05', '2018.04.05', '2018.06.05', None, '2018.04.05'],
+        })
+        mapper = {'date': ['date', 'formatted']}
+        kwargs_map = {'formatted': {'format': '%Y.%m.%d'}}
+        expected = convert_to_type(df.copy(), mapper, kwargs_map=kwargs_map)
+        assert_frame_equal(convert_to_type(df.copy(), mapper, kwargs_map=kwargs_map, date_cache=True), expected)
+        cache = DatetimeCache(maxsize=4)
+        assert_frame_equal(convert_to_type(df.copy(), mapper, kwargs_map=kwargs_map, date_cache=cache), expected)
+        self.assertEqual(len(cache), 4)
+        assert_frame_equal(convert_to_type(df.copy(), mapper, kwargs_map=kwargs_map, date_cache=cache), expected)
+        self.assertListEqual(expected['formatted'].dt.month.tolist()[:3], [6, 4, 6])
+
+    def test_convert_to_type_date_cache_pos_02(self):
+        df = pd.DataFrame({'date': [None, 'not a date', None]})
+        expected = convert_to_type(df.copy(), {'date': 'date'})
+        self.assertEqual(str(expected['date'].dt.tz), 'UTC')
+        for date_cache in (True, DatetimeCache()):
+            assert_frame_equal(convert_to_type(df.copy(), {'date': 'date'}, date_cache=date_cache), expected)
+            assert_frame_equal(
+                convert_to_type(df.iloc[:0], {'date': 'date'}, date_cache=date_cache), expected.iloc[:0]
+            )
+
+    def test_conversion_plan_pos_01(self):
+        first = pd.DataFrame({
+            'int': ['1', '2'],
+            'float': [1.5, 2.0],
+            'date': ['2018-01-01', '2018-01-02'],
+            'object': ['just some', 'strings'],
+        })
+        second = pd.DataFrame({
+            'int': ['1', '100'],
+            'float': [1, 2],
+            'date': ['2018-01-01', None],
+        })
+        plan = ConversionPlan({'integer': 'int', 'float': 'float', 'date': ['date', 'missing']})
+        plan.fit(first)
+        self.assertTrue(ptypes.is_object_dtype(first['int'].dtype))
+        self.assertEqual(set(plan.dtypes), {'int', 'float', 'date'})
+        self.assertEqual(plan.dtypes['int'], 'Int16')
+        assert_frame_equal(
+            first.copy().pipe(plan),
+            convert_to_type(first.copy(), {'integer': 'int', 'float': 'float', 'date': 'date'}).astype(
+                {'int': 'Int16'}
+            )
+        )
+        converted = second.pipe(plan)
+        self.assertEqual(converted['int'].dtype, plan.dtypes['int'])
+        self.assertEqual(converted['float'].dtype, plan.dtypes['float'])
+        self.assertEqual(converted['date'].dtype, plan.dtypes['date'])
+
+    def test_conversion_plan_pos_02(self):
+        plan = ConversionPlan({'integer': 'int'}).fit(pd.DataFrame({'int': [1, 2]}))
+        converted = plan.apply(pd.DataFrame({'int': ['500', None]}))
+        self.assertEqual(converted['int'].dtype, 'Int16')
+        self.assertListEqual(converted['int'].isna().tolist(), [False, True])
+        plan.fit(pd.DataFrame({'int': [1, 1000]}))
+        self.assertEqual(plan.dtypes['int'], 'Int32')
+        plan.fit(pd.DataFrame({'int': [1, 2]}))
+        self.assertEqual(plan.dtypes['int'], 'Int32')
+
+    def test_conversion_plan_neg_01(self):
+        plan = ConversionPlan({'integer': 'int'}).fit(pd.DataFrame({'int': [1, 2]}))
+        with self.assertRaises(ValueError):
+            plan.apply(pd.DataFrame({'int': [1, 100000]}))
+
+    def test_conversion_plan_neg_02(self):
+        plan = ConversionPlan({'number': 'number'}).fit(pd.DataFrame({'number': [1, 2]}))
+        self.assertEqual(plan.dtypes['number'], 'Int64')
+        with self.assertRaisesRegex(ValueError, 'not integers'):
+            plan.apply(pd.DataFrame({'number': [1.5, 2.7]}))
+        self.assertEqual(plan.apply(pd.DataFrame({'number': ['1', None]}))['number'].dtype, 'Int64')
+
+    def test_conversion_plan_neg_03(self):
+        plan = ConversionPlan({'number': 'float'}).fit(
+            pd.DataFrame({'float': np.array([1.5, 2.0], dtype=np.float32)})
+        )
+        self.assertEqual(plan.dtypes['float'], np.float32)
+        self.assertEqual(plan.apply(pd.DataFrame({'float': [0.5, None]}))['float'].dtype, np.float32)
+        with self.assertRaisesRegex(ValueError, 'without loss'):
+            plan.apply(pd.DataFrame({'float': [1.5, 1e300]}))
+
+    def test_optimize_memory_pos_01(self):
+        df = pd.DataFrame({
+            'flag': [0, 1, 1, 0] * 100,
+            'signed': [-1, 2, 300, 4] * 100,
+            'ratio': [0.5, 0.25, np.nan, 2.0] * 100,
+            'precise': [0.1, 0.2, 0.3, 0.4] * 100,
+            'status': ['open', 'closed', 'open', None] * 100,
+            'unique': [str(i) for i in range(400)],
+            'lists': [[1], [2], [3], [4]] * 100,
+            'bool': [True, False, True, True] * 100,
+        })
+        expected = df.copy()
+        result, report = optimize_memory(df, report=True)
+        self.assertEqual(result['flag'].dtype, np.uint8)
+        self.assertEqual(result['signed'].dtype, np.int16)
+        self.assertEqual(result['ratio'].dtype, np.float32)
+        self.assertEqual(result['precise'].dtype, np.float64)
+        self.assertIsInstance(result['status'].dtype, pd.CategoricalDtype)
+        self.assertTrue(ptypes.is_object_dtype(result['unique'].dtype))
+        self.assertTrue(ptypes.is_object_dtype(result['lists'].dtype))
+        self.assertEqual(result['bool'].dtype, bool)
+        assert_frame_equal(result, expected, check_dtype=False, check_categorical=False)
+        self.assertListEqual(report.index.tolist(), expected.columns.tolist())
+        self.assertTrue((report['bytes_after'] <= report['bytes_before']).all())
+        self.assertLess(report['bytes_after'].sum(), report['bytes_before'].sum())
+
     def test_clear_nan_pos_01(self):
         df = pd.DataFrame({
             'testcol1': [1, 2, np.NaN],
@@ -89,6 +378,23 @@ class ConversionsTestCase(unittest.TestCase):
         })
         assert_frame_equal(result, expected_result, check_like=True, check_dtype=False)
 
+    def test_clear_nan_pos_02(self):
+        df = pd.DataFrame({
+            'float': [1.5, np.nan],
+            'int': [1, 2],
+            'date': [pd.Timestamp('2020-01-01'), pd.NaT],
+            'bool': [True, False],
+        })
+        original = df.copy()
+        result = clear_nan(df)
+        assert_frame_equal(df, original)
+        self.assertListEqual(result.values.tolist(), [[1.5, 1, pd.Timestamp('2020-01-01'), True], [None, 2, None, False]])
+        self.assertEqual(result['int'].dtype, np.int64)
+        self.assertEqual(result['bool'].dtype, bool)
+        self.assertTrue(np.shares_memory(result['int'].values, df['int'].values))
+        self.assertIs(clear_nan(df, inplace=True), df)
+        self.assertIsNone(df.loc[1, 'float'])
+
     def test_truncate_strings(self):
         df = pd.DataFrame({
             'strings': [
@@ -120,6 +426,54 @@ class ConversionsTestCase(unittest.TestCase):
         })
         assert_frame_equal(df.pipe(truncate_strings, {'long_strings': 6, 'even_longer_strings': 9}), expected)
 
+    def test_truncate_strings_pos_02(self):
+        df = pd.DataFrame({
+            'mixed': ['foofoo', None, 3, 'ba'],
+            'category': pd.Categorical(['foofoo', 'foobaz', None, 'baz']),
+            'bytes': ['héllo', 'hello', 'ő', None],
+        })
+        result = truncate_strings(df, {'mixed': 3, 'category': 3})
+        self.assertListEqual(result['mixed'].tolist(), ['foo', None, 3, 'ba'])
+        self.assertListEqual(result['category'].cat.categories.tolist(), ['baz', 'foo'])
+        self.assertListEqual(result['category'].astype(object).tolist()[:2], ['foo', 'foo'])
+        self.assertTrue(pd.isnull(result['category'].iloc[2]))
+        result = truncate_strings(df, {'bytes': 2}, unit='bytes')
+        self.assertListEqual(result['bytes'].tolist(), ['h', 'he', 'ő', None])
+        with self.assertRaises(ValueError):
+            truncate_strings(df, {'bytes': 2}, unit='words')
+
+    def test_inplace_pos_01(self):
+        df = pd.DataFrame({'int': ['1', '2'], 'str': ['foofoo', 'bar'], 'float': [1.5, 2.5]})
+        original = df.copy()
+        converted = convert_to_type(df, {'integer': 'int'})
+        truncated = truncate_strings(df, {'str': 3})
+        assert_frame_equal(df, original)
+        self.assertEqual(converted['int'].dtype, np.int8)
+        self.assertListEqual(truncated['str'].tolist(), ['foo', 'bar'])
+        self.assertTrue(np.shares_memory(converted['float'].values, df['float'].values))
+        self.assertIs(truncate_strings(df, {'str': 3}, inplace=True), df)
+        self.assertListEqual(df['str'].tolist(), ['foo', 'bar'])
+
+    def test_n_threads_pos_01(self):
+        df = pd.DataFrame({
+            'int': ['4', '8103', '-7', None],
+            'number': ['1.5', '2', None, '3'],
+            'date': ['2018-06-05', None, '2018-04-05', '2018-06-05'],
+            'str': ['foofoo', 'ba', None, 'bazbaz'],
+        })
+        mapper = {'integer': 'int', 'number': 'number', 'date': 'date'}
+        assert_frame_equal(
+            convert_to_type(df.copy(), mapper, date_cache=DatetimeCache(), n_threads=3),
+            convert_to_type(df.copy(), mapper, date_cache=DatetimeCache())
+        )
+        assert_frame_equal(
+            truncate_strings(df.copy(), {'str': 3, 'number': 1}, n_threads=2),
+            truncate_strings(df.copy(), {'str': 3, 'number': 1})
+        )
+        assert_frame_equal(clear_nan(df, n_threads=4), clear_nan(df))
+        with self.assertRaises(ValueError):
+            clear_nan(df, n_threads=0)
+
 
 if __name__ == '__main__':
     unittest.main()
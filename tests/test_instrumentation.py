@@ -0,0 +1,88 @@
+import tracemalloc
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pandas_extras import (
+    ConversionPlan, DatetimeCache, add_callback, clear_nan, convert_to_type, expand_list,
+    get_adjacency_list_depth, instrument, remove_callback,
+)
+from pandas_extras.instrumentation import instrumented
+
+
+class InstrumentationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'id': [1, 2, 3],
+            'values': [[1, 2], [], [3, 4, 5]],
+        })
+
+    def test_instrument_pos_01(self):
+        with instrument() as events:
+            self.df.pipe(expand_list, 'values').pipe(clear_nan)
+        self.assertEqual([event.function for event in events], ['expand_list', 'clear_nan'])
+        self.assertEqual(events[0][1:5], (3, 2, 6, 2))
+        self.assertGreaterEqual(events[0].seconds, 0)
+        self.assertIsNone(events[0].allocated_bytes)
+        self.assertFalse(any(event.nested for event in events))
+        self.df.pipe(clear_nan)
+        self.assertEqual(len(events), 2)
+
+    def test_instrument_pos_02(self):
+        df = pd.DataFrame({'parent': [np.nan, 0, 1]}, index=pd.RangeIndex(3, name='node'))
+        with instrument(trace_memory=True) as events:
+            get_adjacency_list_depth(df, 'parent')
+        self.assertEqual(events[-1].function, 'get_adjacency_list_depth')
+        self.assertEqual(events[-1].columns_out, 2)
+        self.assertListEqual(
+            [event.nested for event in events], [True] * (len(events) - 1) + [False]
+        )
+        self.assertTrue(all(event.allocated_bytes > 0 for event in events))
+        self.assertGreaterEqual(events[-1].allocated_bytes, max(
+            event.allocated_bytes for event in events[:-1]
+        ))
+
+    def test_instrument_pos_03(self):
+        df = pd.DataFrame({'int': ['1', '2']})
+        with instrument() as events:
+            convert_to_type(df, {'integer': 'int'})
+        self.assertListEqual(
+            [(event.function, event.nested) for event in events],
+            [('ConversionPlan.apply', True), ('convert_to_type', False)]
+        )
+
+    def test_instrument_pos_04(self):
+        @instrumented
+        def allocate(dataframe):
+            buffer = np.ones(10 ** 6)
+            del buffer
+            return clear_nan(dataframe)
+
+        with instrument(trace_memory=True) as events:
+            allocate(self.df)
+        self.assertListEqual([event.nested for event in events], [True, False])
+        self.assertGreaterEqual(events[1].allocated_bytes, 8 * 10 ** 6)
+        if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+
+            self.assertLess(events[0].allocated_bytes, 8 * 10 ** 6)
+
+    def test_instrument_pos_05(self):
+        df = pd.DataFrame({'date': ['2018-01-01', None]})
+        with instrument() as events:
+            ConversionPlan({'date': 'date'}, date_cache=DatetimeCache()).fit(df)
+        self.assertListEqual(
+            [(event.function, event.nested) for event in events], [
+                ('DatetimeCache.parse', True), ('ConversionPlan.apply', True),
+                ('ConversionPlan.fit', False),
+            ]
+        )
+        self.assertEqual(events[0].rows_out, 1)
+
+    def test_add_callback_neg_01(self):
+        events = []
+        add_callback(events.append)
+        remove_callback(events.append)
+        self.df.pipe(clear_nan)
+        self.assertEqual(events, [])
+        with self.assertRaises(ValueError):
+            remove_callback(events.append)
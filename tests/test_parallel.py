@@ -0,0 +1,35 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from pandas_extras import clear_nan, extract_dictionary, parallel_pipe
+
+
+class ParallelTestCase(unittest.TestCase):
+    def test_parallel_pipe_pos_01(self):
+        df = pd.DataFrame({
+            'float': [1.0, np.nan, 2.5, 3.0, np.nan, 4.0, 5.0],
+            'int': [1, 2, 3, 4, 5, 6, 7],
+            'date': pd.date_range('2020-01-01', periods=7),
+            'str': ['a', None, 'c', 'd', None, 'f', 'g'],
+        }, index=[7, 6, 5, 4, 3, 2, 1])
+        assert_frame_equal(
+            parallel_pipe(df, clear_nan, n_workers=2, partitions=3),
+            clear_nan(df)
+        )
+
+    def test_parallel_pipe_pos_02(self):
+        df = pd.DataFrame({
+            'trial_num': [1, 2, 1, 2],
+            'samples': [{'A': 1, 'B': 2}, {'A': 3, 'B': 4}, {'A': 6, 'B': 7}, None],
+        })
+        assert_frame_equal(
+            parallel_pipe(df, extract_dictionary, 'samples', prefix='', n_workers=2),
+            extract_dictionary(df.copy(), 'samples', prefix='')
+        )
+
+    def test_parallel_pipe_neg_01(self):
+        with self.assertRaises(ValueError):
+            parallel_pipe(pd.DataFrame({'a': [1, 2]}), clear_nan, n_workers=0)
@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from pandas_extras import (
+    Pipeline, clear_nan, convert_to_type, expand_list, extract_dict_key, extract_dictionary,
+    truncate_strings,
+)
+
+
+class PipelineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'id': [1, 2, 3],
+            'samples': [
+                {'A': '1', 'B': 'foofoo', 'C': [1, 2]},
+                {'A': '2', 'B': None, 'C': []},
+                None,
+            ],
+        })
+
+    def test_pipeline_pos_01(self):
+        original = self.df.copy()
+        pipeline = Pipeline().\
+            pipe(extract_dict_key, 'samples', 'C', new_column='C').\
+            pipe(extract_dictionary, 'samples', key_list=['A', 'B']).\
+            pipe(convert_to_type, {'integer': 'samples.A'}).\
+            pipe(truncate_strings, {'samples.B': 3}).\
+            pipe(clear_nan)
+        expected = self.df.copy().\
+            pipe(extract_dict_key, 'samples', 'C', new_column='C').\
+            pipe(extract_dictionary, 'samples', key_list=['A', 'B']).\
+            pipe(convert_to_type, {'integer': 'samples.A'}).\
+            pipe(truncate_strings, {'samples.B': 3}).\
+            pipe(clear_nan)
+        assert_frame_equal(pipeline.run(self.df), expected)
+        assert_frame_equal(self.df, original)
+
+    def test_pipeline_pos_02(self):
+        pipeline = Pipeline().\
+            pipe(extract_dictionary, 'samples', key_list=['A', 'C']).\
+            pipe(convert_to_type, {'integer': 'samples.A'}).\
+            drop(['samples.A', 'missing']).\
+            pipe(expand_list, 'samples.C').\
+            pipe(clear_nan)
+        expected = pd.DataFrame({
+            'samples.C': np.array([1.0, 2.0, None, None], dtype=object),
+            'id': [1, 1, 2, 3],
+        }, index=[0, 0, 1, 2])
+        assert_frame_equal(pipeline(self.df), expected, check_like=True)
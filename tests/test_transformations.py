@@ -2,11 +2,12 @@ import unittest
 
 import numpy as np
 import pandas as pd
-from pandas.testing import assert_frame_equal
+from pandas.testing import assert_frame_equal, assert_series_equal
 
 from pandas_extras import (
     concatenate_columns, expand_list, expand_lists,
-    extract_dict_key, extract_dictionary, merge_columns,
+    extract_dict_key, extract_dictionary, filter_list, list_to_indicators, map_list,
+    merge_column_groups, merge_columns, reduce_list,
 )
 
 
@@ -235,6 +236,241 @@ class TransformationsTestCase(unittest.TestCase):
             check_like=True
         )
 
+    def test_expand_lists_typed_pos_01(self):
+        df = pd.DataFrame({
+            'trial_num': [1, 2, 3],
+            'samples': [[1, 2], [3], None],
+            'labels': [['a'], ['b', 'c'], None],
+        })
+        expected = pd.DataFrame({
+            'samples': pd.array([1, 2, 3, None, None], dtype='Int64'),
+            'labels': pd.array(['a', None, 'b', 'c', None], dtype='string'),
+            'trial_num': [1, 1, 2, 2, 3],
+        })
+        assert_frame_equal(
+            expand_lists(df, ['samples', 'labels'], typed=True).reset_index(drop=True),
+            expected, check_like=True
+        )
+        assert_frame_equal(
+            expand_list(df.drop(columns='labels'), 'samples', typed=True).reset_index(drop=True),
+            pd.DataFrame({
+                'samples': pd.array([1, 2, 3, None], dtype='Int64'),
+                'trial_num': [1, 1, 2, 3],
+            }),
+            check_like=True
+        )
+
+    def test_expand_list_categorical_pos_01(self):
+        df = pd.DataFrame({
+            'trial_num': [1, 2, 3],
+            'tags': [['a', 'b'], ['a'], None],
+        })
+        expected = pd.DataFrame({
+            'tags': pd.Categorical(['a', 'b', 'a', None], categories=['a', 'b']),
+            'trial_num': [1, 1, 2, 3],
+        })
+        assert_frame_equal(
+            expand_list(df, 'tags', categorical=True).reset_index(drop=True),
+            expected, check_like=True
+        )
+        self.assertNotIsInstance(
+            expand_list(df, 'tags', categorical='auto')['tags'].dtype, pd.CategoricalDtype
+        )
+        self.assertIsInstance(
+            expand_list(df, 'tags', categorical=0.7)['tags'].dtype, pd.CategoricalDtype
+        )
+
+    def test_expand_list_categorical_pos_02(self):
+        tags = [f'tag{index}' for index in range(300)]
+        df = pd.DataFrame({'tags': [tags[:150], None, tags[100:]]})
+        result = expand_list(df, 'tags', categorical=True)['tags']
+        self.assertListEqual(list(result.cat.categories), tags)
+        self.assertListEqual(result.astype(object).tolist(), expand_list(df, 'tags')['tags'].tolist())
+
+    def test_reduce_list_pos_01(self):
+        df = pd.DataFrame(
+            {
+                'trial_num': [1, 2, 3, 4],
+                'samples': [
+                    [1, 2, 3, 4],
+                    [],
+                    None,
+                    [5, 1],
+                ]
+            }
+        )
+        expected = pd.DataFrame(
+            {
+                'trial_num': [1, 2, 3, 4],
+                'samples.len': [4, 0, 0, 2],
+                'samples.sum': [10, 0, 0, 6],
+                'samples.min': [1, None, None, 1],
+                'samples.max': [4, None, None, 5],
+                'samples.mean': [2.5, None, None, 3.0],
+                'samples.contains': [True, False, False, False],
+            }
+        )
+        result = reduce_list(df, 'samples', funcs=['len', 'sum', 'min', 'max', 'mean'], contains=3)
+        assert_frame_equal(result.drop('samples', axis=1), expected, check_like=True, check_dtype=False)
+
+    def test_reduce_list_pos_02(self):
+        df = pd.DataFrame({'samples': [['b', 'a'], ['c'], np.nan]})
+        expected = df.pipe(expand_list, 'samples', 'value').groupby(level=0)['value'].agg(['min', 'max'])
+        result = reduce_list(df, 'samples', funcs=['min', 'max'], prefix='value', separator='_')
+        self.assertListEqual(result['value_min'].tolist()[:2], expected['min'].tolist()[:2])
+        self.assertListEqual(result['value_max'].tolist()[:2], expected['max'].tolist()[:2])
+        self.assertTrue(pd.isnull(result['value_min'].iloc[2]))
+
+    def test_reduce_list_pos_03(self):
+        df = pd.DataFrame({'samples': [[1.0, np.nan, 3.0], [None], [2, None], []]})
+        expected = df.pipe(expand_list, 'samples').groupby(level=0)['samples'].\
+            agg(['sum', 'min', 'max', 'mean'])
+        result = reduce_list(df, 'samples', funcs=['len', 'sum', 'min', 'max', 'mean'])
+        self.assertListEqual(result['samples.len'].tolist(), [3, 1, 2, 0])
+        for func in ('sum', 'min', 'max', 'mean'):
+            assert_series_equal(
+                result[f'samples.{func}'], expected[func], check_names=False, check_dtype=False
+            )
+
+    def test_reduce_list_pos_04(self):
+        stamps = pd.to_datetime(['2021-01-01', '2021-01-03', '2021-01-02'])
+        df = pd.DataFrame({'samples': [[stamps[0], stamps[1]], [], [stamps[2], None], None]})
+        result = reduce_list(df, 'samples', funcs=['len', 'min', 'max'])
+        self.assertListEqual(result['samples.len'].tolist(), [2, 0, 2, 0])
+        assert_series_equal(
+            result['samples.min'], pd.Series([stamps[0], pd.NaT, stamps[2], pd.NaT]), check_names=False
+        )
+        assert_series_equal(
+            result['samples.max'], pd.Series([stamps[1], pd.NaT, stamps[2], pd.NaT]), check_names=False
+        )
+
+    def test_reduce_list_neg_01(self):
+        df = pd.DataFrame({'samples': [[1, 2], [3]]})
+        with self.assertRaises(ValueError):
+            reduce_list(df, 'samples', funcs=['median'])
+
+    def test_filter_list_pos_01(self):
+        df = pd.DataFrame(
+            {
+                'trial_num': [1, 2, 3, 4],
+                'samples': [
+                    [1, 2, 3, 4],
+                    [1],
+                    [],
+                    None,
+                ]
+            }
+        )
+        expected = pd.DataFrame(
+            {
+                'trial_num': [1, 2, 3, 4],
+                'samples': [[3, 4], [], [], None],
+                'kept': [[1, 4], [1], [], None],
+            }
+        )
+        df = filter_list(df, 'samples', {1, 4}, new_column='kept')
+        df = filter_list(df, 'samples', lambda values: values > 2)
+        assert_frame_equal(df, expected, check_like=True)
+
+    def test_filter_list_pos_02(self):
+        df = pd.DataFrame(
+            {
+                'trial_num': [1, 2, 3, 1, 2, 3],
+                'subject': [1, 1, 1, 2, 2, 2],
+                'samples': [
+                    [1, 2, 3, 4, 5],
+                    [0, 1, 2, 3],
+                    [1, 2, 0],
+                    [1, 0],
+                    [0],
+                    None,
+                ]
+            }
+        ).set_index(['trial_num', 'subject'])
+        filtered = df.assign(samples=[[1, 2, 3, 4, 5], [1, 2, 3], [1, 2], [1], [], None])
+        assert_frame_equal(
+            filter_list(df, 'samples', lambda values: values != 0, expand=True).reset_index(),
+            expand_list(filtered, 'samples').reset_index(),
+            check_like=True, check_dtype=False
+        )
+
+    def test_map_list_pos_01(self):
+        df = pd.DataFrame(
+            {
+                'trial_num': [1, 2, 3],
+                'samples': [[1, 2], [2, 3], None]
+            }
+        )
+        expected = pd.DataFrame(
+            {
+                'trial_num': [1, 2, 3],
+                'samples': [['a', 'b'], ['b', np.nan], None]
+            }
+        )
+        assert_frame_equal(map_list(df, 'samples', {1: 'a', 2: 'b'}), expected, check_like=True)
+
+    def test_map_list_pos_02(self):
+        df = pd.DataFrame(
+            {
+                'trial_num': [1, 2, 3],
+                'samples': [[1, 2], [3], []]
+            }
+        )
+        expected = pd.DataFrame(
+            {
+                'trial_num': [1, 1, 2, 3],
+                'doubled': [2, 4, 6, None],
+            },
+            index=[0, 0, 1, 2]
+        )
+        assert_frame_equal(
+            map_list(df, 'samples', lambda value: value * 2, new_column='doubled', expand=True),
+            expected, check_like=True, check_dtype=False
+        )
+
+    def test_map_list_pos_03(self):
+        stamps = pd.to_datetime(['2021-01-01', '2021-01-02', '2021-01-03'])
+        df = pd.DataFrame({'samples': [[stamps[0], stamps[1]], [stamps[2]], None]})
+        filtered = filter_list(df, 'samples', lambda values: values > stamps[0])
+        self.assertListEqual(filtered['samples'].tolist(), [[stamps[1]], [stamps[2]], None])
+        mapped = map_list(df, 'samples', lambda value: value)
+        self.assertListEqual(mapped['samples'].tolist(), df['samples'].tolist())
+
+    def test_list_to_indicators_pos_01(self):
+        df = pd.DataFrame(
+            {
+                'trial_num': [1, 2, 3, 4],
+                'tags': [
+                    ['a', 'b', 'a'],
+                    ['c'],
+                    [],
+                    None,
+                ]
+            }
+        )
+        expected = pd.DataFrame(
+            {
+                'trial_num': [1, 2, 3, 4],
+                'tags.a': [1, 0, 0, 0],
+                'tags.b': [1, 0, 0, 0],
+                'tags.c': [0, 1, 0, 0],
+            }
+        )
+        result = list_to_indicators(df, 'tags')
+        self.assertTrue(all(isinstance(dtype, pd.SparseDtype) for dtype in result.dtypes[1:]))
+        dense = pd.DataFrame({name: np.asarray(values) for name, values in result.items()})
+        assert_frame_equal(dense, expected, check_like=True, check_dtype=False)
+        assert_frame_equal(list_to_indicators(df, 'tags', sparse=False), expected,
+                           check_like=True, check_dtype=False)
+
+    def test_list_to_indicators_pos_02(self):
+        df = pd.DataFrame({'tags': [[3, 1, 3], [], None, [1]]})
+        (data, indices, indptr), vocabulary = list_to_indicators(df, 'tags', as_csr=True)
+        self.assertListEqual(data.tolist(), [1, 1, 1])
+        self.assertListEqual(indices.tolist(), [0, 1, 1])
+        self.assertListEqual(indptr.tolist(), [0, 2, 2, 2, 3])
+        self.assertListEqual(vocabulary.tolist(), [3, 1])
+
     def test_extract_dict_key_pos_01(self):
         df = pd.DataFrame(
             {
@@ -476,6 +712,55 @@ class TransformationsTestCase(unittest.TestCase):
             expected, check_like=True
         )
 
+    def test_extract_dictionary_inplace(self):
+        df = pd.DataFrame({'id': [1, 2], 'samples': [{'A': 1, 'B': 2}, None]})
+        original = df.copy()
+        result = extract_dictionary(df, 'samples')
+        assert_frame_equal(df, original)
+        self.assertIs(extract_dictionary(df, 'samples', inplace=True), df)
+        assert_frame_equal(df, result)
+        self.assertListEqual(list(df.columns), ['id', 'samples.A', 'samples.B'])
+
+    def test_extract_dictionary_typed_pos_01(self):
+        df = pd.DataFrame({
+            'trial_num': [1, 2, 3],
+            'samples': [
+                {'A': 1, 'B': True, 'C': 'x', 'D': 1.5},
+                {'A': None, 'B': False, 'C': None, 'D': 2},
+                None,
+            ]
+        })
+        expected = pd.DataFrame({
+            'trial_num': [1, 2, 3],
+            'A': pd.array([1, None, None], dtype='Int64'),
+            'B': pd.array([True, False, None], dtype='boolean'),
+            'C': pd.array(['x', None, None], dtype='string'),
+            'D': np.array([1.5, 2.0, np.nan], dtype=np.float32),
+        })
+        assert_frame_equal(extract_dictionary(df, 'samples', prefix='', typed=True), expected)
+
+    def test_extract_dictionary_typed_pos_02(self):
+        df = pd.DataFrame({'samples': [{'A': 2.123456789, 'B': 2 ** 70}, {'A': None, 'B': 1}]})
+        result = extract_dictionary(df, 'samples', prefix='', typed=True)
+        self.assertEqual(result['A'].dtype, np.float64)
+        self.assertEqual(result['A'].iloc[0], 2.123456789)
+        self.assertEqual(result['B'].dtype, object)
+        self.assertListEqual(result['B'].tolist(), [2 ** 70, 1])
+
+    def test_extract_dictionary_categorical_pos_01(self):
+        df = pd.DataFrame({
+            'trial_num': [1, 2, 3],
+            'samples': [{'status': 'ok', 'ids': [1]}, {'status': 'ok', 'ids': [2]}, None],
+        })
+        result = extract_dictionary(df, 'samples', prefix='', categorical=0.9)
+        assert_frame_equal(result, pd.DataFrame({
+            'trial_num': [1, 2, 3],
+            'status': pd.Categorical(['ok', 'ok', None]),
+            'ids': [[1], [2], None],
+        }))
+        with self.assertRaises(TypeError):
+            extract_dictionary(df, 'samples', prefix='', categorical=True)
+
     def test_merge_columns(self):
         dataframe = pd.DataFrame([
             {
@@ -543,15 +828,32 @@ class TransformationsTestCase(unittest.TestCase):
                 'new_col_name': 'TEST6'
             }
         ])
-        merge_columns(dataframe, ['test_1', 'test_3', 'test_4'], 'new_col_name', keep='first')
+        dataframe = merge_columns(dataframe, ['test_1', 'test_3', 'test_4'], 'new_col_name', keep='first')
         assert_frame_equal(dataframe, expected_result_first, check_like=True)
-        merge_columns(dataframe, ['test_1', 'test_3', 'test_4'], 'new_col_name', keep='last')
+        dataframe = merge_columns(dataframe, ['test_1', 'test_3', 'test_4'], 'new_col_name', keep='last')
         assert_frame_equal(dataframe, expected_result_last, check_like=True)
         with self.assertRaises(ValueError):
             merge_columns(dataframe, ['test_1', 'test_3', 'test_4'], 'new_col_name', keep='something_wrong')
         with self.assertRaises(ValueError):
             merge_columns(dataframe, ['test_1', 'test_3', 'test_4'], 'new_col_name', aggr=sum, keep='first')
 
+    def test_merge_columns_inplace(self):
+        dataframe = pd.DataFrame({'test_1': [1, None], 'test_2': [3, 4]})
+        original = dataframe.copy()
+        result = merge_columns(dataframe, ['test_1', 'test_2'], 'merged', keep='first')
+        assert_frame_equal(dataframe, original)
+        self.assertListEqual(result['merged'].tolist(), [1, 4])
+        self.assertTrue(np.shares_memory(result['test_2'].values, dataframe['test_2'].values))
+        self.assertIs(
+            merge_columns(dataframe, ['test_1', 'test_2'], 'merged', keep='last', inplace=True),
+            dataframe
+        )
+        self.assertListEqual(dataframe['merged'].tolist(), [3, 4])
+        dataframe = pd.DataFrame({'b': [1, 2], 'm': [3, 4]})
+        summed = merge_columns(dataframe, ['b', 'm'], 'm', aggr='sum')
+        assert_frame_equal(dataframe, pd.DataFrame({'b': [1, 2], 'm': [3, 4]}))
+        assert_frame_equal(summed, pd.DataFrame({'b': [1, 2], 'm': [4, 6]}))
+
     def test_merge_columns_aggr(self):
         dataframe = pd.DataFrame([
             {
@@ -596,10 +898,120 @@ class TransformationsTestCase(unittest.TestCase):
                 'new_col_name': 10
             }
         ])
-        merge_columns(dataframe, ['test_1', 'test_3', 'test_4'], 'new_col_name', aggr=sum)
+        dataframe = merge_columns(dataframe, ['test_1', 'test_3', 'test_4'], 'new_col_name', aggr=sum)
         assert_frame_equal(dataframe, expected_result, check_like=True, check_dtype=False)
         with self.assertRaises(ValueError):
-            merge_columns(dataframe, ['test_1', 'test_3', 'test_4'], 'new_col_name', aggr='sum')
+            merge_columns(dataframe, ['test_1', 'test_3', 'test_4'], 'new_col_name', aggr='median')
+
+    def test_merge_columns_named_aggr(self):
+        dataframe = pd.DataFrame({
+            'test_1': [1, 0, np.nan],
+            'test_2': [5, 9, 8],
+            'test_3': [9, np.nan, 1],
+        })
+        columns = ['test_1', 'test_2', 'test_3']
+        expected = {
+            'sum': [15, 9, 9],
+            'count': [3, 2, 2],
+            'min': [1, 0, 1],
+            'max': [9, 9, 8],
+            'mean': [5, 4.5, 4.5],
+            'any': [True, True, True],
+        }
+        for aggr, values in expected.items():
+            dataframe = merge_columns(dataframe, columns, aggr, aggr=aggr)
+            self.assertListEqual(dataframe[aggr].tolist(), values)
+
+    def test_merge_columns_block(self):
+        dataframe = pd.DataFrame({
+            'test_1': [1, 0, 3, 2, 7],
+            'test_2': [5, 9, 8, 2, 1],
+            'test_3': [9, 4, 1, 6, 0],
+        })
+        columns = ['test_1', 'test_2', 'test_3']
+        calls = []
+
+        def weighted(block):
+            calls.append(block.shape)
+            return block @ np.array([1, 10, 100])
+
+        dataframe = merge_columns(dataframe, columns, 'block', aggr=weighted, raw='block')
+        dataframe = merge_columns(dataframe, columns, 'chunked', aggr=weighted, raw='block', chunk_size=2)
+        dataframe = merge_columns(dataframe, columns, 'rows', aggr=lambda row: row @ np.array([1, 10, 100]), raw=True)
+        self.assertListEqual(calls, [(5, 3), (2, 3), (2, 3), (1, 3)])
+        self.assertListEqual(dataframe['block'].tolist(), [951, 490, 183, 622, 17])
+        self.assertListEqual(dataframe['chunked'].tolist(), dataframe['block'].tolist())
+        self.assertListEqual(dataframe['rows'].tolist(), dataframe['block'].tolist())
+        with self.assertRaises(ValueError):
+            merge_columns(dataframe, columns, 'block', aggr=lambda block: block.sum(), raw='block')
+
+    def test_merge_columns_keep_numeric(self):
+        dataframe = pd.DataFrame({
+            'test_1': [np.nan, 2.0, np.nan],
+            'test_2': [1.0, 3.0, np.nan],
+            'test_3': [4.0, np.nan, np.nan],
+        })
+        dataframe = merge_columns(dataframe, ['test_1', 'test_2', 'test_3'], 'first', keep='first')
+        dataframe = merge_columns(dataframe, ['test_1', 'test_2', 'test_3'], 'last', keep='last')
+        self.assertTrue(pd.api.types.is_float_dtype(dataframe['first'].dtype))
+        assert_frame_equal(
+            dataframe[['first', 'last']],
+            pd.DataFrame({'first': [1.0, 2.0, np.nan], 'last': [4.0, 3.0, np.nan]})
+        )
+
+    def test_merge_column_groups_pos_01(self):
+        dataframe = pd.DataFrame({
+            'key': ['TICKET-1', 'TICKET-2', 'TICKET-3'],
+            'addr_v1': [None, 'Main St.', None],
+            'addr_v2': ['Elm St.', 'Oak St.', None],
+            'zip_v1': [1000, None, None],
+            'zip_v2': [None, 2000, 3000],
+        })
+        expected = pd.DataFrame({
+            'key': ['TICKET-1', 'TICKET-2', 'TICKET-3'],
+            'addr': ['Elm St.', 'Main St.', None],
+            'zip': [1000.0, 2000.0, 3000.0],
+        })
+        assert_frame_equal(
+            merge_column_groups(dataframe, r'(.*)_v\d', keep='first', drop=True), expected
+        )
+        assert_frame_equal(
+            merge_column_groups(
+                dataframe, {'addr': ['addr_v1', 'addr_v2'], 'zip': ['zip_v1', 'zip_v2', 'zip_v3']},
+                keep='first', drop=True
+            ),
+            expected
+        )
+
+    def test_merge_column_groups_pos_02(self):
+        dataframe = pd.DataFrame({
+            'a_1': [1, 2],
+            'a_2': [3, 4],
+            'b_1': [5, 6],
+            'b': [0, 0],
+        })
+        result = merge_column_groups(dataframe, {'a': ['a_1', 'a_2'], 'b': ['b', 'b_1']}, aggr='sum')
+        self.assertListEqual(list(result.columns), ['a_1', 'a_2', 'b_1', 'b', 'a'])
+        self.assertListEqual(result['a'].tolist(), [4, 6])
+        self.assertListEqual(result['b'].tolist(), [5, 6])
+
+    def test_merge_column_groups_pos_03(self):
+        dataframe = pd.DataFrame({'a': [1, 2], 'b': [3, 4], 'c': [5, 6]})
+        result = merge_column_groups(dataframe, {'a': ['a', 'b'], 'd': ['c']}, aggr='sum', drop=False)
+        self.assertListEqual(list(result.columns), ['a', 'b', 'c', 'd'])
+        assert_frame_equal(
+            result[['a', 'b', 'c']],
+            merge_columns(dataframe, ['a', 'b'], 'a', aggr='sum'), check_dtype=False
+        )
+
+    def test_merge_column_groups_neg_01(self):
+        dataframe = pd.DataFrame({'a_1': [1, 2], 'a_2': [3, 4]})
+        with self.assertRaises(ValueError):
+            merge_column_groups(dataframe, {'a': ['a_1'], 'c': ['c_1']}, keep='first')
+        with self.assertRaises(ValueError):
+            merge_column_groups(dataframe, r'a_\d', keep='first')
+        with self.assertRaises(ValueError):
+            merge_column_groups(dataframe, r'(a)_\d', keep='something_wrong')
 
     def test_concatenate_columns_pos_01(self):
         dataframe = pd.DataFrame([
@@ -630,7 +1042,7 @@ class TransformationsTestCase(unittest.TestCase):
             {'key': 'TICKET-2', 'user': 'Alice', 'role': 'reporter'},
             {'key': 'TICKET-3', 'user': 'Bob', 'role': 'assignee'},
             {'key': 'TICKET-3', 'user': 'Alice', 'role': 'reporter'},
-        ]).set_index('key')[['user', 'role']]
+        ]).set_index('key')[['user', 'role']].astype({'role': 'category'})
         assert_frame_equal(
             concatenate_columns(dataframe, ['assignee', 'reporter'], 'user', descriptor='role'),
             expected
@@ -649,13 +1061,60 @@ class TransformationsTestCase(unittest.TestCase):
             {'key': 'TICKET-2', 'user': 'Alice', 'role': 'r'},
             {'key': 'TICKET-3', 'user': 'Bob', 'role': 'a'},
             {'key': 'TICKET-3', 'user': 'Alice', 'role': 'r'},
-        ]).set_index('key')[['user', 'role']]
+        ]).set_index('key')[['user', 'role']].astype({'role': 'category'})
         mapper = {'assignee': 'a', 'reporter': 'r'}
         assert_frame_equal(
             concatenate_columns(dataframe, ['assignee', 'reporter'], 'user', descriptor='role', mapper=mapper),
             expected
         )
 
+    def test_concatenate_columns_pos_04(self):
+        dataframe = pd.DataFrame([
+            {'key': 'TICKET-3', 'assignee': 'Carol', 'reporter': 'Alice', 'creator': 'Bob'},
+            {'key': 'TICKET-1', 'assignee': 'Bob', 'reporter': 'Alice', 'creator': 'Bob'},
+        ]).set_index('key')
+        expected = pd.DataFrame([
+            {'key': 'TICKET-3', 'user': 'Carol', 'role': 'user'},
+            {'key': 'TICKET-3', 'user': 'Alice', 'role': 'user'},
+            {'key': 'TICKET-3', 'user': 'Bob', 'role': 'creator'},
+            {'key': 'TICKET-1', 'user': 'Bob', 'role': 'user'},
+            {'key': 'TICKET-1', 'user': 'Alice', 'role': 'user'},
+            {'key': 'TICKET-1', 'user': 'Bob', 'role': 'creator'},
+        ]).set_index('key').astype({'role': pd.CategoricalDtype(['user', 'creator'])})
+        mapper = {'assignee': 'user', 'reporter': 'user'}
+        assert_frame_equal(
+            concatenate_columns(
+                dataframe, ['assignee', 'reporter', 'creator'], 'user', descriptor='role', mapper=mapper
+            ),
+            expected
+        )
+        assert_frame_equal(
+            concatenate_columns(
+                dataframe, ['assignee', 'reporter', 'creator'], 'user', descriptor='role',
+                mapper=mapper, categorical=False
+            ),
+            expected.astype({'role': expected['user'].dtype})
+        )
+
+    def test_concatenate_columns_pos_05(self):
+        dataframe = pd.DataFrame({
+            'assignee': pd.array([1, None], dtype='Int64'),
+            'reporter': pd.array([3, 4], dtype='Int64'),
+            'state': pd.Categorical(['open', 'closed']),
+            'resolution': pd.Categorical(['open', 'closed']),
+        })
+        result = concatenate_columns(dataframe, ['assignee', 'reporter'], 'user')
+        assert_series_equal(
+            result['user'],
+            pd.Series(pd.array([1, 3, None, 4], dtype='Int64'), index=[0, 0, 1, 1], name='user')
+        )
+        result = concatenate_columns(dataframe, ['state', 'resolution'], 'status')
+        assert_series_equal(
+            result['status'],
+            pd.Series(pd.Categorical(['open', 'open', 'closed', 'closed'], categories=['closed', 'open']),
+                      index=[0, 0, 1, 1], name='status')
+        )
+
     def test_concatenate_columns_non_existent_col(self):
         dataframe = pd.DataFrame([
             {'key': 'TICKET-1', 'assignee': 'Bob', 'reporter': 'Alice'},
@@ -669,7 +1128,7 @@ class TransformationsTestCase(unittest.TestCase):
             {'key': 'TICKET-2', 'user': 'Alice', 'role': 'r'},
             {'key': 'TICKET-3', 'user': 'Bob', 'role': 'a'},
             {'key': 'TICKET-3', 'user': 'Alice', 'role': 'r'},
-        ]).set_index('key')[['user', 'role']]
+        ]).set_index('key')[['user', 'role']].astype({'role': 'category'})
         mapper = {'assignee': 'a', 'reporter': 'r'}
         assert_frame_equal(
             concatenate_columns(dataframe, ['assignee', 'reporter', 'creator'], 'user', descriptor='role', mapper=mapper),